@@ -111,13 +111,19 @@ def on_message(
 ) -> None:
     ext_session = ext_session_wr()
     assert ext_session is not None, "ext.Session has been deleted"
+    # A batch usually carries many messages for a handful of queues; decode
+    # each distinct URI once and share the resulting string between messages.
+    queue_uris: Dict[bytes, str] = {}
     for data, guid, queue_uri, properties_tuple in messages:
         properties, property_types = properties_tuple
         property_types_py = {
             k: property_type_to_py[v] for k, v in property_types.items()
         }
+        queue_uri_str = queue_uris.get(queue_uri)
+        if queue_uri_str is None:
+            queue_uri_str = queue_uris[queue_uri] = queue_uri.decode()
         message = create_message(
-            data, guid, queue_uri.decode(), properties, property_types_py
+            data, guid, queue_uri_str, properties, property_types_py
         )
         message_handle = create_message_handle(message, ext_session)
         user_callback(message, message_handle)
@@ -145,8 +151,9 @@ def on_ack(
     ack_status_mapping: Dict[int, AckStatus],
     acks: Iterable[Tuple[int, bytes, Optional[bytes], bytes, Callable[[Ack], None]]],
 ) -> None:
+    to_py_status = ack_status_mapping.get
     for status, status_description, guid, queue_uri, user_callback in acks:
-        py_status = ack_status_mapping.get(status, AckStatus.UNRECOGNIZED)
+        py_status = to_py_status(status, AckStatus.UNRECOGNIZED)
         user_callback(
             create_ack(
                 guid,
@@ -54,6 +54,14 @@ def DefaultMonitor() -> Union[BasicHealthMonitor, None]:
 
 DEFAULT_TIMEOUT = DefaultTimeoutType()
 KNOWN_MONITORS = ("blazingmq.BasicHealthMonitor",)
+# Checked in order by `_default_property_type_for_subclass`, so `bool` must
+# come before `int`
+DEFAULT_PROPERTY_TYPES = {
+    bool: PropertyType.BOOL,
+    int: PropertyType.INT64,
+    str: PropertyType.STRING,
+    bytes: PropertyType.BINARY,
+}
 
 
 def _validate_timeouts(timeouts: Timeouts) -> Timeouts:
@@ -99,6 +107,31 @@ def _convert_stats_dump_interval(interval: Optional[float]) -> Optional[float]:
     raise ValueError(f"stats_dump_interval must be nonnegative, was {interval}")
 
 
+def _default_property_type_for_subclass(val: object) -> PropertyType:
+    """Return the default property type for a subclass of a supported type.
+
+    Values whose exact type is a key of `DEFAULT_PROPERTY_TYPES` are looked up
+    directly, so this is only needed for subclasses such as `enum.IntEnum`.
+    """
+    for base, property_type in DEFAULT_PROPERTY_TYPES.items():
+        if isinstance(val, base):
+            return property_type
+    raise Error("Property values of type %r are not supported" % type(val).__name__)
+
+
+def _property_name_bytes(name: Union[str, bytes]) -> bytes:
+    """Convert a property name given as `str` or `bytes` to `bytes`.
+
+    Anything else, including subclasses of `str` and `bytes`, is left to
+    `six.ensure_binary`, which raises `TypeError` for unsupported types.
+    """
+    if type(name) is str:
+        return name.encode("utf-8")
+    if type(name) is bytes:
+        return name
+    return six.ensure_binary(name)
+
+
 def _collect_properties_and_types(
     properties: Optional[PropertyValueDict],
     property_type_overrides: Optional[PropertyTypeDict],
@@ -108,26 +141,17 @@ def _collect_properties_and_types(
 
     if properties:
         for name, val in properties.items():
-            if isinstance(val, bool):
-                default_type = PropertyType.BOOL
-            elif isinstance(val, int):
-                default_type = PropertyType.INT64
-            elif isinstance(val, str):
-                default_type = PropertyType.STRING
-            elif isinstance(val, bytes):
-                default_type = PropertyType.BINARY
-            else:
-                raise Error(
-                    "Property values of type %r are not supported" % type(val).__name__
-                )
+            default_type = DEFAULT_PROPERTY_TYPES.get(type(val))
+            if default_type is None:
+                default_type = _default_property_type_for_subclass(val)
 
-            name_bytes = six.ensure_binary(name)
+            name_bytes = _property_name_bytes(name)
             property_val_by_name[name_bytes] = val
             property_type_by_name[name_bytes] = default_type
 
     if property_type_overrides:
         for name, override_type in property_type_overrides.items():
-            name_bytes = six.ensure_binary(name)
+            name_bytes = _property_name_bytes(name)
             if name_bytes not in property_type_by_name:
                 raise Error("Received override for non-existent property %r" % name)
             property_type_by_name[name_bytes] = override_type
@@ -311,6 +335,8 @@ class SessionOptions:
         self.stats_dump_interval = stats_dump_interval
 
     def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
         if not isinstance(other, SessionOptions):
             return False
         return (
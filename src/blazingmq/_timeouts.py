@@ -62,6 +62,8 @@ class Timeouts:
         self.close_queue_timeout = close_queue_timeout
 
     def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
         if not isinstance(other, Timeouts):
             return False
         return (
@@ -218,15 +218,21 @@ MessageUtils::get_message_property_and_type(
         return false;
     }
 
-    if (PyDict_SetItemString(properties, iterator.name().c_str(), value.get())) {
+    // Build the key once and share it between both dictionaries rather than
+    // decoding the property name separately for each insertion.
+    const bsl::string& name = iterator.name();
+    bslma::ManagedPtr<PyObject> key = RefUtils::toManagedPtr(
+            PyUnicode_FromStringAndSize(name.c_str(), name.length()));
+    bslma::ManagedPtr<PyObject> type = RefUtils::toManagedPtr(PyLong_FromLong(ptype));
+    if (!key || !type) {
         return false;
     }
 
-    if (PyDict_SetItemString(
-                property_types,
-                iterator.name().c_str(),
-                PyLong_FromLong(ptype)))
-    {
+    if (PyDict_SetItem(properties, key.get(), value.get())) {
+        return false;
+    }
+
+    if (PyDict_SetItem(property_types, key.get(), type.get())) {
         return false;
     }
 
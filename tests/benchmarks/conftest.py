@@ -0,0 +1,33 @@
+# Copyright 2019-2023 Bloomberg Finance L.P.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+from unit.support import DEFAULT_OPEN_KWARGS
+from unit.support import QUEUE_NAME
+from unit.support import start_mocked_session
+
+
+@pytest.fixture()
+def started_session():
+    session, _mock = start_mocked_session()
+    yield session, _mock
+    session.stop()
+
+
+@pytest.fixture()
+def opened_session(started_session):
+    session, _ = started_session
+    session.open_queue_sync(QUEUE_NAME, **DEFAULT_OPEN_KWARGS)
+    return started_session
@@ -0,0 +1,84 @@
+# Copyright 2019-2023 Bloomberg Finance L.P.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+from unit.support import DEFAULT_OPEN_KWARGS
+from unit.support import INT32
+from unit.support import QUEUE_NAME
+from unit.support import STRING
+from unit.support import dummy_callback
+from unit.support import sdk_mock
+
+from blazingmq._ext import Session
+
+pytest.importorskip("pytest_benchmark")
+
+PROPERTIES = {b"name": ("value", STRING), b"count": (42, INT32)}
+ROUNDS = 1000
+WARMUP_ROUNDS = 10
+
+
+def bench_with_fresh_mock(benchmark, _mock, target, *args, **kwargs):
+    # Clear the calls recorded on the mock before every round, outside of the
+    # timed section, so the timings don't grow with the mock's call history.
+    benchmark.pedantic(
+        target,
+        args=args,
+        kwargs=kwargs,
+        setup=_mock.reset_mock,
+        rounds=ROUNDS,
+        warmup_rounds=WARMUP_ROUNDS,
+    )
+
+
+def test_bench_session_start_stop(benchmark):
+    # GIVEN
+    _mock = sdk_mock(start=0, stop=None)
+
+    def start_stop():
+        Session(dummy_callback, _mock=_mock).stop()
+
+    # WHEN / THEN
+    bench_with_fresh_mock(benchmark, _mock, start_stop)
+
+
+def test_bench_open_close_queue(benchmark, started_session):
+    # GIVEN
+    session, _mock = started_session
+
+    def open_close():
+        session.open_queue_sync(QUEUE_NAME, **DEFAULT_OPEN_KWARGS)
+        session.close_queue_sync(QUEUE_NAME)
+
+    # WHEN / THEN
+    bench_with_fresh_mock(benchmark, _mock, open_close)
+
+
+@pytest.mark.parametrize(
+    "properties", [None, PROPERTIES], ids=["no_properties", "properties"]
+)
+def test_bench_post(benchmark, opened_session, properties):
+    # GIVEN
+    session, _mock = opened_session
+
+    # WHEN / THEN
+    bench_with_fresh_mock(
+        benchmark,
+        _mock,
+        session.post,
+        QUEUE_NAME,
+        b"Some_message",
+        properties=properties,
+    )
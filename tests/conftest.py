@@ -19,3 +19,12 @@ def pytest_addoption(parser):
         "--timeout", action="store", dest="bmq_timeout", default=30, type=float
     )
     parser.addoption("--broker_uri", action="store", dest="bmq_broker_uri", type=str)
+
+
+def pytest_collection_modifyitems(items):
+    # Tag every test with the suite it belongs to, so runs can be narrowed
+    # down with `-m unit` or `-m "not integration"`.
+    for item in items:
+        suite = item.nodeid.split("/")[1] if item.nodeid.startswith("tests/") else None
+        if suite in ("unit", "integration"):
+            item.add_marker(suite)
@@ -16,9 +16,47 @@
 import mock
 import pytest
 
+from .support import DEFAULT_OPEN_KWARGS
+from .support import QUEUE_NAME
+from .support import READ_ONLY_OPEN_KWARGS
+from .support import make_session
+from .support import start_mocked_session
+
+
+@pytest.fixture()
+def ext_cls(monkeypatch):
+    ext_cls = mock.MagicMock()
+    monkeypatch.setattr("blazingmq._session.ExtSession", ext_cls)
+    return ext_cls
+
+
+@pytest.fixture()
+def ext(ext_cls):
+    ext_cls.mock_add_spec([])
+    return ext_cls.return_value
+
+
+@pytest.fixture()
+def session(ext):
+    return make_session()
+
+
+@pytest.fixture()
+def started_session():
+    session, _mock = start_mocked_session()
+    yield session, _mock
+    session.stop()
+
+
+@pytest.fixture()
+def opened_session(started_session):
+    session, _ = started_session
+    session.open_queue_sync(QUEUE_NAME, **DEFAULT_OPEN_KWARGS)
+    return started_session
+
 
 @pytest.fixture()
-def ext():
-    with mock.patch("blazingmq._session.ExtSession") as s:
-        s.mock_add_spec([])
-        yield s.return_value
+def read_only_opened_session(started_session):
+    session, _ = started_session
+    session.open_queue_sync(QUEUE_NAME, **READ_ONLY_OPEN_KWARGS)
+    return started_session
@@ -13,28 +13,84 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import functools
+
 import mock
 
 from blazingmq import PropertyType
 from blazingmq import Session
 from blazingmq._ext import PROPERTY_TYPES_FROM_PY_MAPPING
+from blazingmq._ext import Session as ExtSession
 
 QUEUE_NAME = b"bmq://bmq.dummy_domain.some_namespace/dummy_queue"
 
+DEFAULT_QUEUE_OPTIONS = {
+    "consumer_priority": 0,
+    "max_unconfirmed_messages": 0,
+    "max_unconfirmed_bytes": 0,
+}
+DEFAULT_OPEN_KWARGS = {"read": True, "write": True, **DEFAULT_QUEUE_OPTIONS}
+READ_ONLY_OPEN_KWARGS = {**DEFAULT_OPEN_KWARGS, "write": False}
+WRITE_ONLY_OPEN_KWARGS = {**DEFAULT_OPEN_KWARGS, "read": False}
+
 
 def dummy_callback(*args):
     print(args)
 
 
+# Mock attributes holding the batches of events that the native mock session
+# emits, one batch per call to ``openQueueSync``.
+EVENT_BATCH_ATTRS = ("enqueue_messages", "enqueue_acks")
+
+
 def sdk_mock(**kwargs):
     _mock = mock.NonCallableMock(spec=list(kwargs))
-    config = {k + ".return_value": v for k, v in kwargs.items()}
+    config = {
+        k + ".return_value": v for k, v in kwargs.items() if k not in EVENT_BATCH_ATTRS
+    }
     _mock.configure_mock(**config)
+    for name in EVENT_BATCH_ATTRS:
+        if name in kwargs:
+            # Copy the batches once up front, since the native side pops each
+            # batch off this list as it's emitted, and serve them from a plain
+            # function rather than a child mock that would record every lookup.
+            batches = [list(batch) for batch in kwargs[name]]
+            setattr(_mock, name, lambda batches=batches: batches)
     _mock.options = None
     mock.seal(_mock)
     return _mock
 
 
+class RecordingStub:
+    """Stand-in whose named methods just record the arguments they receive.
+
+    Cheaper than a `mock.MagicMock` for tests that only need to check which
+    calls were made.
+    """
+
+    def __init__(self, *names):
+        self.calls = {name: [] for name in names}
+        for name in names:
+            setattr(self, name, functools.partial(self._record, name))
+
+    def _record(self, name, *args, **kwargs):
+        self.calls[name].append((args, kwargs))
+
+
+def start_mocked_session():
+    """Start an extension session backed by a mock that accepts every call."""
+    _mock = sdk_mock(
+        start=0,
+        openQueueSync=0,
+        configureQueueSync=0,
+        closeQueueSync=0,
+        post=0,
+        confirmMessage=0,
+        stop=None,
+    )
+    return ExtSession(dummy_callback, _mock=_mock), _mock
+
+
 def make_session():
     return Session(dummy_callback, dummy_callback, host_health_monitor=None)
 
@@ -14,6 +14,7 @@
 # limitations under the License.
 
 import queue
+import sys
 
 import pytest
 
@@ -25,11 +26,14 @@ from blazingmq._messages import pretty_hex
 from .support import BINARY
 from .support import BOOL
 from .support import CHAR
+from .support import DEFAULT_OPEN_KWARGS
 from .support import INT32
 from .support import INT64
 from .support import QUEUE_NAME
+from .support import READ_ONLY_OPEN_KWARGS
 from .support import SHORT
 from .support import STRING
+from .support import WRITE_ONLY_OPEN_KWARGS
 from .support import dummy_callback
 from .support import sdk_mock
 
@@ -75,22 +79,8 @@ def test_multiple_message_consumption():
     session = Session(dummy_callback, on_message=go_on, _mock=mock)
 
     # WHEN
-    session.open_queue_sync(
-        QUEUE_NAME + b"1",
-        read=True,
-        write=True,
-        consumer_priority=0,
-        max_unconfirmed_messages=0,
-        max_unconfirmed_bytes=0,
-    )
-    session.open_queue_sync(
-        QUEUE_NAME + b"2",
-        read=True,
-        write=False,
-        consumer_priority=0,
-        max_unconfirmed_messages=0,
-        max_unconfirmed_bytes=0,
-    )
+    session.open_queue_sync(QUEUE_NAME + b"1", **DEFAULT_OPEN_KWARGS)
+    session.open_queue_sync(QUEUE_NAME + b"2", **READ_ONLY_OPEN_KWARGS)
 
     # THEN
     m1 = q.get(timeout=1)
@@ -135,14 +125,7 @@ def test_mock_enforces_all_message_params(params):
 
     # WHEN
     with pytest.raises(Exception) as exc:
-        session.open_queue_sync(
-            QUEUE_NAME,
-            read=True,
-            write=True,
-            consumer_priority=0,
-            max_unconfirmed_messages=0,
-            max_unconfirmed_bytes=0,
-        )
+        session.open_queue_sync(QUEUE_NAME, **DEFAULT_OPEN_KWARGS)
 
     # THEN
     assert exc.type is IndexError
@@ -170,14 +153,7 @@ def test_enqueue_messages_with_invalid_guid():
 
     # WHEN
     with pytest.raises(Exception) as exc:
-        session.open_queue_sync(
-            QUEUE_NAME,
-            read=True,
-            write=True,
-            consumer_priority=0,
-            max_unconfirmed_messages=0,
-            max_unconfirmed_bytes=0,
-        )
+        session.open_queue_sync(QUEUE_NAME, **DEFAULT_OPEN_KWARGS)
 
     # THEN
     assert exc.type is RuntimeError
@@ -198,14 +174,7 @@ def test_enqueue_messages_with_invalid_queue():
 
     # WHEN
     with pytest.raises(Exception) as exc:
-        session.open_queue_sync(
-            QUEUE_NAME,
-            read=True,
-            write=True,
-            consumer_priority=0,
-            max_unconfirmed_messages=0,
-            max_unconfirmed_bytes=0,
-        )
+        session.open_queue_sync(QUEUE_NAME, **DEFAULT_OPEN_KWARGS)
 
     # THEN
     assert exc.type is RuntimeError
@@ -242,22 +211,8 @@ def test_multiple_ack_consumption():
     session = Session(dummy_callback, _mock=mock)
 
     # WHEN
-    session.open_queue_sync(
-        q1_name,
-        read=False,
-        write=True,
-        consumer_priority=0,
-        max_unconfirmed_messages=0,
-        max_unconfirmed_bytes=0,
-    )
-    session.open_queue_sync(
-        q2_name,
-        read=True,
-        write=True,
-        consumer_priority=0,
-        max_unconfirmed_messages=0,
-        max_unconfirmed_bytes=0,
-    )
+    session.open_queue_sync(q1_name, **WRITE_ONLY_OPEN_KWARGS)
+    session.open_queue_sync(q2_name, **DEFAULT_OPEN_KWARGS)
     session.post(q1_name, b"fea")
     session.post(q2_name, b"fea")
 
@@ -306,14 +261,7 @@ def test_enqueue_acks_with_invalid_guid():
     mock = sdk_mock(start=0, openQueueSync=0, enqueue_acks=acks, post=0, stop=None)
 
     session = Session(dummy_callback, _mock=mock)
-    session.open_queue_sync(
-        QUEUE_NAME,
-        read=False,
-        write=True,
-        consumer_priority=0,
-        max_unconfirmed_messages=0,
-        max_unconfirmed_bytes=0,
-    )
+    session.open_queue_sync(QUEUE_NAME, **WRITE_ONLY_OPEN_KWARGS)
 
     # WHEN
     with pytest.raises(Exception) as exc:
@@ -331,14 +279,7 @@ def test_enqueue_acks_with_invalid_queue():
     mock = sdk_mock(start=0, openQueueSync=0, enqueue_acks=acks, post=0, stop=None)
 
     session = Session(dummy_callback, _mock=mock)
-    session.open_queue_sync(
-        QUEUE_NAME,
-        read=False,
-        write=True,
-        consumer_priority=0,
-        max_unconfirmed_messages=0,
-        max_unconfirmed_bytes=0,
-    )
+    session.open_queue_sync(QUEUE_NAME, **WRITE_ONLY_OPEN_KWARGS)
 
     # WHEN
     with pytest.raises(Exception) as exc:
@@ -349,6 +290,40 @@ def test_enqueue_acks_with_invalid_queue():
     assert exc.match("^Failed to get queue$")
 
 
+def test_consumed_messages_are_not_retained():
+    # GIVEN
+    messages = [
+        [
+            (
+                b"payload",
+                b"%02X00000000003039CD8101000000270F" % i,
+                QUEUE_NAME,
+                {b"an_int64": (i, INT64)},
+            )
+            for i in range(100)
+        ]
+    ]
+    mock = sdk_mock(start=0, openQueueSync=0, enqueue_messages=messages, stop=None)
+    q = queue.Queue()
+
+    def go_on(*args):
+        q.put(*args)
+
+    session = Session(dummy_callback, on_message=go_on, _mock=mock)
+
+    # WHEN
+    session.open_queue_sync(QUEUE_NAME, **READ_ONLY_OPEN_KWARGS)
+    received = [q.get(timeout=1) for _ in range(100)]
+    session.stop()
+
+    # THEN
+    # Each message should be referenced exactly as often as a fresh object
+    # stored the same way, i.e. nothing else has kept hold of it.
+    control = [object() for _ in range(100)]
+    for message, obj in zip(received, control):
+        assert sys.getrefcount(message) == sys.getrefcount(obj)
+
+
 def test_receiving_message_properties_success():
     # GIVEN
     messages = [
@@ -378,14 +353,7 @@ def test_receiving_message_properties_success():
     session = Session(dummy_callback, on_message=go_on, _mock=mock)
 
     # WHEN
-    session.open_queue_sync(
-        QUEUE_NAME + b"1",
-        read=True,
-        write=True,
-        consumer_priority=0,
-        max_unconfirmed_messages=0,
-        max_unconfirmed_bytes=0,
-    )
+    session.open_queue_sync(QUEUE_NAME + b"1", **DEFAULT_OPEN_KWARGS)
 
     # THEN
     m1 = q.get(timeout=1)
@@ -441,14 +409,7 @@ def test_receiving_empty_does_not_raise(properties, p_type, expected_value):
     session = Session(dummy_callback, on_message=go_on, _mock=mock)
 
     # WHEN
-    session.open_queue_sync(
-        QUEUE_NAME + b"1",
-        read=True,
-        write=True,
-        consumer_priority=0,
-        max_unconfirmed_messages=0,
-        max_unconfirmed_bytes=0,
-    )
+    session.open_queue_sync(QUEUE_NAME + b"1", **DEFAULT_OPEN_KWARGS)
 
     # THEN
     m1 = q.get(timeout=1)
@@ -478,14 +439,7 @@ def test_interface_error_on_non_utf8_string_property():
     session = Session(record_events, on_message=dummy_callback, _mock=mock)
 
     # WHEN
-    session.open_queue_sync(
-        QUEUE_NAME + b"1",
-        read=True,
-        write=True,
-        consumer_priority=0,
-        max_unconfirmed_messages=0,
-        max_unconfirmed_bytes=0,
-    )
+    session.open_queue_sync(QUEUE_NAME + b"1", **DEFAULT_OPEN_KWARGS)
 
     # THEN
     expected_error = "STRING property 'prop' has non-UTF-8 data\n"
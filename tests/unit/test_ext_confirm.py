@@ -22,6 +22,7 @@ from blazingmq._ext import Session
 from blazingmq._messages import create_message
 
 from .support import QUEUE_NAME
+from .support import READ_ONLY_OPEN_KWARGS
 from .support import dummy_callback
 from .support import sdk_mock
 
@@ -30,18 +31,10 @@ from .support import sdk_mock
     "confirm_rc, confirm_error",
     [(-1, "UNKNOWN"), (-3, "NOT_CONNECTED"), (-5, "NOT_SUPPORTED"), (-8, "NOT_READY")],
 )
-def test_confirm_fails_with_error(confirm_rc, confirm_error):
+def test_confirm_fails_with_error(read_only_opened_session, confirm_rc, confirm_error):
     # GIVEN
-    mock = sdk_mock(start=0, openQueueSync=0, confirmMessage=confirm_rc, stop=None)
-    session = Session(dummy_callback, _mock=mock)
-    session.open_queue_sync(
-        QUEUE_NAME,
-        read=True,
-        write=False,
-        consumer_priority=0,
-        max_unconfirmed_messages=0,
-        max_unconfirmed_bytes=0,
-    )
+    session, mock = read_only_opened_session
+    mock.confirmMessage.return_value = confirm_rc
 
     # WHEN
     with pytest.raises(Exception) as exc:
@@ -60,18 +53,9 @@ def test_confirm_fails_with_error(confirm_rc, confirm_error):
     assert exc.match(rf"Failed to confirm message \[.+\]: {confirm_error}")
 
 
-def test_confirm_with_invalid_guid():
+def test_confirm_with_invalid_guid(opened_session):
     # GIVEN
-    mock = sdk_mock(start=0, openQueueSync=0, confirmMessage=0, stop=None)
-    session = Session(dummy_callback, _mock=mock)
-    session.open_queue_sync(
-        QUEUE_NAME,
-        read=True,
-        write=True,
-        consumer_priority=0,
-        max_unconfirmed_messages=0,
-        max_unconfirmed_bytes=0,
-    )
+    session, _ = opened_session
 
     # WHEN
     with pytest.raises(Exception) as exc:
@@ -106,18 +90,9 @@ def test_confirm_with_invalid_queue():
     assert exc.match("^Queue not opened$")
 
 
-def test_confirm_successful():
+def test_confirm_successful(read_only_opened_session):
     # GIVEN
-    mock = sdk_mock(start=0, openQueueSync=0, confirmMessage=0, stop=None)
-    session = Session(dummy_callback, _mock=mock)
-    session.open_queue_sync(
-        QUEUE_NAME,
-        read=True,
-        write=False,
-        consumer_priority=0,
-        max_unconfirmed_messages=0,
-        max_unconfirmed_bytes=0,
-    )
+    session, mock = read_only_opened_session
     guid = b"\x00\x00\x0f\x00\x07\xd9\xd1z\xd0\xe1\x8c.z\x86\xe1T"
 
     # WHEN
@@ -141,14 +116,7 @@ def test_confirm_with_closing_queue():
         start=0, openQueueSync=0, confirmMessage=0, close_on_get=True, stop=None
     )
     session = Session(dummy_callback, _mock=mock)
-    session.open_queue_sync(
-        QUEUE_NAME,
-        read=True,
-        write=False,
-        consumer_priority=0,
-        max_unconfirmed_messages=0,
-        max_unconfirmed_bytes=0,
-    )
+    session.open_queue_sync(QUEUE_NAME, **READ_ONLY_OPEN_KWARGS)
     guid = b"\x00\x00\x0f\x00\x07\xd9\xd1z\xd0\xe1\x8c.z\x86\xe1T"
 
     # WHEN
@@ -186,14 +154,7 @@ def test_message_handle_can_confirm():
     session = Session(dummy_callback, on_message=on_message, _mock=_mock)
 
     # WHEN
-    session.open_queue_sync(
-        QUEUE_NAME,
-        read=True,
-        write=False,
-        consumer_priority=0,
-        max_unconfirmed_messages=0,
-        max_unconfirmed_bytes=0,
-    )
+    session.open_queue_sync(QUEUE_NAME, **READ_ONLY_OPEN_KWARGS)
     waiting.wait()
 
     # THEN
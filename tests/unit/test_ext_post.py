@@ -22,6 +22,7 @@ from blazingmq import exceptions
 from blazingmq._ext import COMPRESSION_ALGO_FROM_PY_MAPPING as compression_map
 from blazingmq._ext import Session
 
+from .support import DEFAULT_OPEN_KWARGS
 from .support import QUEUE_NAME
 from .support import dummy_callback
 from .support import sdk_mock
@@ -31,18 +32,10 @@ from .support import sdk_mock
     "post_rc, post_error",
     [(-1, "UNKNOWN"), (-3, "NOT_CONNECTED"), (-5, "NOT_SUPPORTED"), (-8, "NOT_READY")],
 )
-def test_post_fails_with_error(post_rc, post_error):
+def test_post_fails_with_error(opened_session, post_rc, post_error):
     # GIVEN
-    mock = sdk_mock(start=0, openQueueSync=0, post=post_rc, stop=None)
-    session = Session(dummy_callback, _mock=mock)
-    session.open_queue_sync(
-        QUEUE_NAME,
-        read=True,
-        write=True,
-        consumer_priority=0,
-        max_unconfirmed_messages=0,
-        max_unconfirmed_bytes=0,
-    )
+    session, mock = opened_session
+    mock.post.return_value = post_rc
 
     # WHEN
     with pytest.raises(Exception) as exc:
@@ -53,18 +46,10 @@ def test_post_fails_with_error(post_rc, post_error):
     assert exc.match(f"Failed to post message to .+dummy_queue queue: {post_error}")
 
 
-def test_post_failure_reference_not_leaked():
+def test_post_failure_reference_not_leaked(opened_session):
     # GIVEN
-    mock = sdk_mock(start=0, openQueueSync=0, post=-1, stop=None)
-    session = Session(dummy_callback, _mock=mock)
-    session.open_queue_sync(
-        QUEUE_NAME,
-        read=True,
-        write=True,
-        consumer_priority=0,
-        max_unconfirmed_messages=0,
-        max_unconfirmed_bytes=0,
-    )
+    session, mock = opened_session
+    mock.post.return_value = -1
 
     def go_on(*args):
         pass
@@ -81,18 +66,9 @@ def test_post_failure_reference_not_leaked():
     assert not cb_ref()
 
 
-def test_post_invalid_queue_reference_not_leaked():
+def test_post_invalid_queue_reference_not_leaked(opened_session):
     # GIVEN
-    mock = sdk_mock(start=0, openQueueSync=0, post=0, stop=None)
-    session = Session(dummy_callback, _mock=mock)
-    session.open_queue_sync(
-        QUEUE_NAME,
-        read=True,
-        write=True,
-        consumer_priority=0,
-        max_unconfirmed_messages=0,
-        max_unconfirmed_bytes=0,
-    )
+    session, _ = opened_session
 
     def go_on(*args):
         pass
@@ -113,18 +89,9 @@ def test_post_invalid_queue_reference_not_leaked():
     "prop_type, expected_exception",
     [(100, ValueError), (2**63, OverflowError), ("", TypeError)],
 )
-def test_post_with_invalid_property_type(prop_type, expected_exception):
+def test_post_with_invalid_property_type(opened_session, prop_type, expected_exception):
     # GIVEN
-    mock = sdk_mock(start=0, openQueueSync=0, post=0, stop=None)
-    session = Session(dummy_callback, _mock=mock)
-    session.open_queue_sync(
-        QUEUE_NAME,
-        read=True,
-        write=True,
-        consumer_priority=0,
-        max_unconfirmed_messages=0,
-        max_unconfirmed_bytes=0,
-    )
+    session, _ = opened_session
     payload = b"Some_message"
 
     # WHEN
@@ -135,18 +102,9 @@ def test_post_with_invalid_property_type(prop_type, expected_exception):
     assert exc.type is expected_exception
 
 
-def test_post_with_empty_key():
+def test_post_with_empty_key(opened_session):
     # GIVEN
-    mock = sdk_mock(start=0, openQueueSync=0, post=0, stop=None)
-    session = Session(dummy_callback, _mock=mock)
-    session.open_queue_sync(
-        QUEUE_NAME,
-        read=True,
-        write=True,
-        consumer_priority=0,
-        max_unconfirmed_messages=0,
-        max_unconfirmed_bytes=0,
-    )
+    session, _ = opened_session
     payload = b"Some_message"
 
     # WHEN
@@ -159,18 +117,9 @@ def test_post_with_empty_key():
 
 
 @pytest.mark.parametrize("values", [(b"something",), (1,), tuple()])
-def test_post_with_insufficient_tuple_values(values):
+def test_post_with_insufficient_tuple_values(opened_session, values):
     # GIVEN
-    mock = sdk_mock(start=0, openQueueSync=0, post=0, stop=None)
-    session = Session(dummy_callback, _mock=mock)
-    session.open_queue_sync(
-        QUEUE_NAME,
-        read=True,
-        write=True,
-        consumer_priority=0,
-        max_unconfirmed_messages=0,
-        max_unconfirmed_bytes=0,
-    )
+    session, _ = opened_session
     payload = b"Some_message"
 
     # WHEN
@@ -181,18 +130,9 @@ def test_post_with_insufficient_tuple_values(values):
     assert exc.type is IndexError
 
 
-def test_post_with_non_tuple_value():
+def test_post_with_non_tuple_value(opened_session):
     # GIVEN
-    mock = sdk_mock(start=0, openQueueSync=0, post=0, stop=None)
-    session = Session(dummy_callback, _mock=mock)
-    session.open_queue_sync(
-        QUEUE_NAME,
-        read=True,
-        write=True,
-        consumer_priority=0,
-        max_unconfirmed_messages=0,
-        max_unconfirmed_bytes=0,
-    )
+    session, _ = opened_session
     payload = b"Some_message"
 
     # WHEN
@@ -204,18 +144,9 @@ def test_post_with_non_tuple_value():
     assert exc.match("'the_key' value is not a tuple.")
 
 
-def test_post_unicode_key():
+def test_post_unicode_key(opened_session):
     # GIVEN
-    mock = sdk_mock(start=0, openQueueSync=0, post=0, stop=None)
-    session = Session(dummy_callback, _mock=mock)
-    session.open_queue_sync(
-        QUEUE_NAME,
-        read=True,
-        write=True,
-        consumer_priority=0,
-        max_unconfirmed_messages=0,
-        max_unconfirmed_bytes=0,
-    )
+    session, _ = opened_session
     payload = b"Some_message"
 
     # WHEN
@@ -239,14 +170,7 @@ def test_session_with_valid_compression(compression):
         message_compression_algorithm=compression,
         _mock=mock,
     )
-    session.open_queue_sync(
-        QUEUE_NAME,
-        read=True,
-        write=True,
-        consumer_priority=0,
-        max_unconfirmed_messages=0,
-        max_unconfirmed_bytes=0,
-    )
+    session.open_queue_sync(QUEUE_NAME, **DEFAULT_OPEN_KWARGS)
 
     # WHEN
     payload = b"x" * 1024
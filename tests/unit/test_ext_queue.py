@@ -13,24 +13,43 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import re
+
 import pytest
 
 from blazingmq import exceptions
-from blazingmq._ext import Session
 
+from .support import DEFAULT_OPEN_KWARGS
+from .support import DEFAULT_QUEUE_OPTIONS
 from .support import QUEUE_NAME
-from .support import dummy_callback
-from .support import sdk_mock
+
+EXPECTED_DEFAULT_OPTIONS = {
+    "consumer_priority": 0,
+    "max_unconfirmed_messages": 0,
+    "max_unconfirmed_bytes": 0,
+    "suspends_on_bad_host_health": False,
+}
+EXPECTED_CUSTOM_OPTIONS = {
+    "consumer_priority": 1,
+    "max_unconfirmed_messages": 2,
+    "max_unconfirmed_bytes": 3,
+    "suspends_on_bad_host_health": True,
+}
+EXPECTED_OPEN_CALL_KWARGS = {
+    "uri": QUEUE_NAME,
+    "flags": 6,
+    "options": EXPECTED_DEFAULT_OPTIONS,
+    "timeout": 0,
+}
 
 
 @pytest.mark.parametrize(
     "read, write, flags",
     [(True, True, 6), (True, False, 2), (False, True, 4)],
 )
-def test_open_flags_are_correct(read, write, flags):
+def test_open_flags_are_correct(started_session, read, write, flags):
     # GIVEN
-    mock = sdk_mock(start=0, openQueueSync=0, stop=None)
-    session = Session(dummy_callback, _mock=mock)
+    session, mock = started_session
 
     # WHEN
     session.open_queue_sync(
@@ -43,63 +62,33 @@ def test_open_flags_are_correct(read, write, flags):
     )
 
     # THEN
-    mock.openQueueSync.assert_called_once_with(
-        uri=QUEUE_NAME,
-        flags=flags,
-        options={
-            "consumer_priority": 0,
-            "max_unconfirmed_bytes": 0,
-            "max_unconfirmed_messages": 0,
-            "suspends_on_bad_host_health": False,
-        },
-        timeout=0,
-    )
+    assert mock.openQueueSync.call_count == 1
+    assert mock.openQueueSync.call_args.kwargs == {
+        **EXPECTED_OPEN_CALL_KWARGS,
+        "flags": flags,
+    }
 
 
-def test_open_timeout_propagated():
+def test_open_timeout_propagated(started_session):
     # GIVEN
-    mock = sdk_mock(start=0, openQueueSync=0, stop=None)
-    session = Session(dummy_callback, _mock=mock)
+    session, mock = started_session
 
     # WHEN
-    session.open_queue_sync(
-        QUEUE_NAME,
-        read=True,
-        write=True,
-        consumer_priority=0,
-        max_unconfirmed_messages=0,
-        max_unconfirmed_bytes=0,
-        timeout=123,
-    )
+    session.open_queue_sync(QUEUE_NAME, **DEFAULT_OPEN_KWARGS, timeout=123)
 
     # THEN
-    mock.openQueueSync.assert_called_once_with(
-        uri=QUEUE_NAME,
-        flags=6,
-        options={
-            "consumer_priority": 0,
-            "max_unconfirmed_bytes": 0,
-            "max_unconfirmed_messages": 0,
-            "suspends_on_bad_host_health": False,
-        },
-        timeout=123,
-    )
+    assert mock.openQueueSync.call_count == 1
+    assert mock.openQueueSync.call_args.kwargs == {
+        **EXPECTED_OPEN_CALL_KWARGS,
+        "timeout": 123,
+    }
 
 
-def test_close_timeout_propagated():
+def test_close_timeout_propagated(opened_session):
     # GIVEN
-    mock = sdk_mock(start=0, openQueueSync=0, closeQueueSync=0, stop=None)
-    session = Session(dummy_callback, _mock=mock)
+    session, mock = opened_session
 
     # WHEN
-    session.open_queue_sync(
-        QUEUE_NAME,
-        read=True,
-        write=True,
-        consumer_priority=0,
-        max_unconfirmed_messages=0,
-        max_unconfirmed_bytes=0,
-    )
     session.close_queue_sync(
         QUEUE_NAME,
         timeout=123,
@@ -109,10 +98,9 @@ def test_close_timeout_propagated():
     mock.closeQueueSync.assert_called_once_with(timeout=123)
 
 
-def test_open_options_are_correctly_propagated():
+def test_open_options_are_correctly_propagated(started_session):
     # GIVEN
-    mock = sdk_mock(start=0, openQueueSync=0, stop=None)
-    session = Session(dummy_callback, _mock=mock)
+    session, mock = started_session
 
     # WHEN
     session.open_queue_sync(
@@ -126,140 +114,91 @@ def test_open_options_are_correctly_propagated():
     )
 
     # THEN
-    mock.openQueueSync.assert_called_once_with(
-        uri=QUEUE_NAME,
-        flags=6,
-        options={
-            "consumer_priority": 1,
-            "max_unconfirmed_messages": 2,
-            "max_unconfirmed_bytes": 3,
-            "suspends_on_bad_host_health": True,
-        },
-        timeout=0,
-    )
-
+    assert mock.openQueueSync.call_count == 1
+    assert mock.openQueueSync.call_args.kwargs == {
+        **EXPECTED_OPEN_CALL_KWARGS,
+        "options": EXPECTED_CUSTOM_OPTIONS,
+    }
 
-def test_open_fails_with_timeout():
-    # GIVEN
-    mock = sdk_mock(start=0, openQueueSync=-2, stop=None)
-    session = Session(dummy_callback, _mock=mock)
-
-    # WHEN
-    with pytest.raises(Exception) as exc:
-        session.open_queue_sync(
-            QUEUE_NAME,
-            read=True,
-            write=True,
-            consumer_priority=0,
-            max_unconfirmed_messages=0,
-            max_unconfirmed_bytes=0,
-        )
 
-    # THEN
-    assert exc.type is exceptions.BrokerTimeoutError
-    assert exc.match("Failed to open .+dummy_queue queue: TIMEOUT: the_error_string")
-
-
-@pytest.mark.parametrize(
-    "open_rc, open_error",
-    [(-1, "UNKNOWN"), (-3, "NOT_CONNECTED"), (-5, "NOT_SUPPORTED"), (-8, "NOT_READY")],
-)
-def test_open_fails_with_error(open_rc, open_error):
-    # GIVEN
-    mock = sdk_mock(start=0, openQueueSync=open_rc, stop=None)
-    session = Session(dummy_callback, _mock=mock)
-
-    # WHEN
-    with pytest.raises(Exception) as exc:
-        session.open_queue_sync(
-            QUEUE_NAME,
-            read=True,
-            write=True,
-            consumer_priority=0,
-            max_unconfirmed_messages=0,
-            max_unconfirmed_bytes=0,
-        )
-
-    # THEN
-    assert exc.type is exceptions.Error
-    assert exc.match(
-        f"Failed to open .+dummy_queue queue: {open_error}: the_error_string"
+# Mock method and call arguments for each `<operation>_queue_sync` method
+QUEUE_OPERATIONS = {
+    "open": ("openQueueSync", DEFAULT_OPEN_KWARGS),
+    "configure": ("configureQueueSync", DEFAULT_QUEUE_OPTIONS),
+    "close": ("closeQueueSync", {}),
+}
+QUEUE_FAILURE_RE = {
+    (operation, error): re.compile(
+        f"Failed to {operation} .+dummy_queue queue: {error}: the_error_string"
     )
+    for operation in QUEUE_OPERATIONS
+    for error in ("TIMEOUT", "UNKNOWN", "NOT_CONNECTED", "NOT_SUPPORTED", "NOT_READY")
+}
+QUEUE_NOT_OPENED_RE = re.compile("^Queue not opened$")
 
 
 @pytest.mark.parametrize(
-    "close_rc, close_error",
-    [(-1, "UNKNOWN"), (-3, "NOT_CONNECTED"), (-5, "NOT_SUPPORTED"), (-8, "NOT_READY")],
+    "operation, rc, expected_exception, error",
+    [
+        ("open", -2, exceptions.BrokerTimeoutError, "TIMEOUT"),
+        ("open", -1, exceptions.Error, "UNKNOWN"),
+        ("open", -3, exceptions.Error, "NOT_CONNECTED"),
+        ("open", -5, exceptions.Error, "NOT_SUPPORTED"),
+        ("open", -8, exceptions.Error, "NOT_READY"),
+        ("close", -1, exceptions.Error, "UNKNOWN"),
+        ("close", -3, exceptions.Error, "NOT_CONNECTED"),
+        ("close", -5, exceptions.Error, "NOT_SUPPORTED"),
+        ("close", -8, exceptions.Error, "NOT_READY"),
+        ("configure", -2, exceptions.BrokerTimeoutError, "TIMEOUT"),
+    ],
 )
-def test_close_fails_with_error(close_rc, close_error):
+def test_queue_operation_fails_with_error(
+    started_session, operation, rc, expected_exception, error
+):
     # GIVEN
-    mock = sdk_mock(start=0, openQueueSync=0, closeQueueSync=close_rc, stop=None)
-    session = Session(dummy_callback, _mock=mock)
-    session.open_queue_sync(
-        QUEUE_NAME,
-        read=True,
-        write=True,
-        consumer_priority=0,
-        max_unconfirmed_messages=0,
-        max_unconfirmed_bytes=0,
-    )
+    session, mock = started_session
+    mock_method, kwargs = QUEUE_OPERATIONS[operation]
+    if operation != "open":
+        session.open_queue_sync(QUEUE_NAME, **DEFAULT_OPEN_KWARGS)
+    getattr(mock, mock_method).return_value = rc
 
     # WHEN
-    with pytest.raises(Exception) as exc:
-        session.close_queue_sync(QUEUE_NAME)
+    with pytest.raises(
+        expected_exception, match=QUEUE_FAILURE_RE[operation, error]
+    ) as exc:
+        getattr(session, f"{operation}_queue_sync")(QUEUE_NAME, **kwargs)
 
     # THEN
-    assert exc.type is exceptions.Error
-    assert exc.match(
-        f"Failed to close .+dummy_queue queue: {close_error}: the_error_string"
-    )
+    assert exc.type is expected_exception
 
 
-def test_close_before_open_fails():
+def test_close_before_open_fails(started_session):
     # GIVEN
-    mock = sdk_mock(start=0, openQueueSync=0, stop=None)
-    session = Session(dummy_callback, _mock=mock)
+    session, _ = started_session
 
     # WHEN
-    with pytest.raises(Exception) as exc:
+    with pytest.raises(exceptions.Error, match=QUEUE_NOT_OPENED_RE) as exc:
         session.close_queue_sync(QUEUE_NAME)
 
     # THEN
     assert exc.type is exceptions.Error
-    assert exc.match("^Queue not opened$")
 
 
-def test_configure_before_open_fails():
+def test_configure_before_open_fails(started_session):
     # GIVEN
-    mock = sdk_mock(start=0, stop=None)
-    session = Session(dummy_callback, _mock=mock)
+    session, _ = started_session
 
     # WHEN
-    with pytest.raises(Exception) as exc:
-        session.configure_queue_sync(
-            QUEUE_NAME,
-            consumer_priority=0,
-            max_unconfirmed_messages=0,
-            max_unconfirmed_bytes=0,
-        )
+    with pytest.raises(exceptions.Error, match=QUEUE_NOT_OPENED_RE) as exc:
+        session.configure_queue_sync(QUEUE_NAME, **DEFAULT_QUEUE_OPTIONS)
 
     # THEN
     assert exc.type is exceptions.Error
-    assert exc.match("^Queue not opened$")
 
 
-def test_configure_arguments_propagate():
+def test_configure_arguments_propagate(opened_session):
     # GIVEN
-    mock = sdk_mock(start=0, openQueueSync=0, configureQueueSync=0, stop=None)
-    session = Session(dummy_callback, _mock=mock)
-    session.open_queue_sync(
-        QUEUE_NAME,
-        read=True,
-        write=True,
-        consumer_priority=0,
-        max_unconfirmed_messages=0,
-        max_unconfirmed_bytes=0,
-    )
+    session, mock = opened_session
 
     # WHEN
     session.configure_queue_sync(
@@ -271,29 +210,16 @@ def test_configure_arguments_propagate():
     )
 
     # THEN
-    mock.configureQueueSync.assert_called_once_with(
-        options={
-            "consumer_priority": 1,
-            "max_unconfirmed_messages": 2,
-            "max_unconfirmed_bytes": 3,
-            "suspends_on_bad_host_health": True,
-        },
-        timeout=0.0,
-    )
+    assert mock.configureQueueSync.call_count == 1
+    assert mock.configureQueueSync.call_args.kwargs == {
+        "options": EXPECTED_CUSTOM_OPTIONS,
+        "timeout": 0.0,
+    }
 
 
-def test_configure_timeout_propagates():
+def test_configure_timeout_propagates(opened_session):
     # Given
-    mock = sdk_mock(start=0, openQueueSync=0, configureQueueSync=0, stop=None)
-    session = Session(dummy_callback, _mock=mock)
-    session.open_queue_sync(
-        QUEUE_NAME,
-        read=True,
-        write=True,
-        consumer_priority=0,
-        max_unconfirmed_messages=0,
-        max_unconfirmed_bytes=0,
-    )
+    session, mock = opened_session
 
     # WHEN
     session.configure_queue_sync(
@@ -306,41 +232,8 @@ def test_configure_timeout_propagates():
     )
 
     # THEN
-    mock.configureQueueSync.assert_called_once_with(
-        options={
-            "consumer_priority": 1,
-            "max_unconfirmed_messages": 2,
-            "max_unconfirmed_bytes": 3,
-            "suspends_on_bad_host_health": False,
-        },
-        timeout=1.0,
-    )
-
-
-def test_configure_fails_with_timeout():
-    # GIVEN
-    mock = sdk_mock(start=0, openQueueSync=0, configureQueueSync=-2, stop=None)
-    session = Session(dummy_callback, _mock=mock)
-    session.open_queue_sync(
-        QUEUE_NAME,
-        read=True,
-        write=True,
-        consumer_priority=0,
-        max_unconfirmed_messages=0,
-        max_unconfirmed_bytes=0,
-    )
-
-    # WHEN
-    with pytest.raises(Exception) as exc:
-        session.configure_queue_sync(
-            QUEUE_NAME,
-            consumer_priority=0,
-            max_unconfirmed_messages=0,
-            max_unconfirmed_bytes=0,
-        )
-
-    # THEN
-    assert exc.type is exceptions.BrokerTimeoutError
-    assert exc.match(
-        "Failed to configure .+dummy_queue queue: TIMEOUT: the_error_string"
-    )
+    assert mock.configureQueueSync.call_count == 1
+    assert mock.configureQueueSync.call_args.kwargs == {
+        "options": {**EXPECTED_CUSTOM_OPTIONS, "suspends_on_bad_host_health": False},
+        "timeout": 1.0,
+    }
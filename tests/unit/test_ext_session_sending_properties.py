@@ -17,7 +17,6 @@ import pytest
 
 from blazingmq import CompressionAlgorithmType
 from blazingmq._ext import COMPRESSION_ALGO_FROM_PY_MAPPING as compression_map
-from blazingmq._ext import Session
 
 from .support import BINARY
 from .support import BOOL
@@ -27,45 +26,26 @@ from .support import INT64
 from .support import QUEUE_NAME
 from .support import SHORT
 from .support import STRING
-from .support import dummy_callback
-from .support import sdk_mock
 
+NO_COMPRESSION = compression_map.get(CompressionAlgorithmType.NONE)
 
-def test_post_with_non_dict_properties():
+
+def test_post_with_non_dict_properties(opened_session):
     # GIVEN
-    mock = sdk_mock(start=0, openQueueSync=0, post=0, stop=None)
-    session = Session(dummy_callback, _mock=mock)
-    session.open_queue_sync(
-        QUEUE_NAME,
-        read=True,
-        write=True,
-        consumer_priority=0,
-        max_unconfirmed_messages=0,
-        max_unconfirmed_bytes=0,
-    )
+    session, _ = opened_session
     payload = b"Some_message"
 
     # WHEN
-    with pytest.raises(Exception) as exc:
+    with pytest.raises(ValueError, match="'properties' is not a dictionary.") as exc:
         session.post(QUEUE_NAME, payload, "")
 
     # THEN
     assert exc.type is ValueError
-    assert exc.match("'properties' is not a dictionary.")
 
 
-def test_put_queue_single_message_with_valid_properties():
+def test_put_queue_single_message_with_valid_properties(opened_session):
     # GIVEN
-    mock = sdk_mock(start=0, openQueueSync=0, post=0, stop=None)
-    session = Session(dummy_callback, _mock=mock)
-    session.open_queue_sync(
-        QUEUE_NAME,
-        read=True,
-        write=True,
-        consumer_priority=0,
-        max_unconfirmed_messages=0,
-        max_unconfirmed_bytes=0,
-    )
+    session, mock = opened_session
     payload = b"Some_message"
 
     # WHEN
@@ -83,10 +63,11 @@ def test_put_queue_single_message_with_valid_properties():
     )
 
     # THEN
-    mock.post.assert_called_once_with(
-        payload=payload,
-        queue_uri=QUEUE_NAME,
-        properties=(
+    assert mock.post.call_count == 1
+    assert mock.post.call_args.kwargs == {
+        "payload": payload,
+        "queue_uri": QUEUE_NAME,
+        "properties": (
             {
                 "a_char": b"a",
                 "a_string": "af\xE4ae",
@@ -104,8 +85,8 @@ def test_put_queue_single_message_with_valid_properties():
                 "an_int64": INT64,
             },
         ),
-        compression_algorithm_type=compression_map.get(CompressionAlgorithmType.NONE),
-    )
+        "compression_algorithm_type": NO_COMPRESSION,
+    }
 
 
 @pytest.mark.parametrize(
@@ -121,61 +102,43 @@ def test_put_queue_single_message_with_valid_properties():
         ({b"test4": (b"", BOOL)}, "bytes"),
     ],
 )
-def test_post_with_invalid_types_properties(properties, expected_type):
+def test_post_with_invalid_types_properties(opened_session, properties, expected_type):
     # GIVEN
-    mock = sdk_mock(start=0, openQueueSync=0, post=0, stop=None)
-    session = Session(dummy_callback, _mock=mock)
-    session.open_queue_sync(
-        QUEUE_NAME,
-        read=True,
-        write=True,
-        consumer_priority=0,
-        max_unconfirmed_messages=0,
-        max_unconfirmed_bytes=0,
-    )
+    session, _ = opened_session
     payload = b"Some_message"
 
+    property_name = next(iter(properties)).decode("ascii")
+    expected_message = "'%s' value is of the incorrect type, '%s' provided" % (
+        property_name,
+        expected_type,
+    )
+
     # WHEN
-    property_name = list(properties.keys())[0].decode("ascii")
-    with pytest.raises(Exception) as exc:
+    with pytest.raises(TypeError, match=expected_message) as exc:
         session.post(QUEUE_NAME, payload, properties)
 
     # THEN
     assert exc.type is TypeError
-    assert exc.match(
-        "'%s' value is of the incorrect type, '%s' provided"
-        % (property_name, expected_type)
-    )
 
 
 @pytest.mark.parametrize(
     "value",
     [b"", b"fe"],
 )
-def test_invalid_values_for_char_property(value):
+def test_invalid_values_for_char_property(opened_session, value):
     # GIVEN
-    mock = sdk_mock(start=0, openQueueSync=0, post=0, stop=None)
-    session = Session(dummy_callback, _mock=mock)
-    session.open_queue_sync(
-        QUEUE_NAME,
-        read=True,
-        write=True,
-        consumer_priority=0,
-        max_unconfirmed_messages=0,
-        max_unconfirmed_bytes=0,
-    )
+    session, _ = opened_session
     payload = b"Some_message"
-    num_bytes = len(value)
+    expected_message = (
+        "'test' value does not have exactly 1 byte, %s bytes provided" % len(value)
+    )
 
     # WHEN
-    with pytest.raises(Exception) as exc:
+    with pytest.raises(TypeError, match=expected_message) as exc:
         session.post(QUEUE_NAME, payload, {b"test": (value, CHAR)})
 
     # THEN
     assert exc.type is TypeError
-    assert exc.match(
-        "'test' value does not have exactly 1 byte, %s bytes provided" % num_bytes
-    )
 
 
 @pytest.mark.parametrize(
@@ -193,30 +156,22 @@ def test_invalid_values_for_char_property(value):
         ({b"an_int64": (54321, INT64)}, ({"an_int64": 54321}, {"an_int64": INT64})),
     ],
 )
-def test_post_with_compatible_properties(properties, expected):
+def test_post_with_compatible_properties(opened_session, properties, expected):
     # GIVEN
-    mock = sdk_mock(start=0, openQueueSync=0, post=0, stop=None)
-    session = Session(dummy_callback, _mock=mock)
-    session.open_queue_sync(
-        QUEUE_NAME,
-        read=True,
-        write=True,
-        consumer_priority=0,
-        max_unconfirmed_messages=0,
-        max_unconfirmed_bytes=0,
-    )
+    session, mock = opened_session
     payload = b"Some_message"
 
     # WHEN
     session.post(QUEUE_NAME, payload, properties)
 
     # THEN
-    mock.post.assert_called_once_with(
-        payload=payload,
-        queue_uri=QUEUE_NAME,
-        properties=expected,
-        compression_algorithm_type=compression_map.get(CompressionAlgorithmType.NONE),
-    )
+    assert mock.post.call_count == 1
+    assert mock.post.call_args.kwargs == {
+        "payload": payload,
+        "queue_uri": QUEUE_NAME,
+        "properties": expected,
+        "compression_algorithm_type": NO_COMPRESSION,
+    }
 
 
 @pytest.mark.parametrize(
@@ -233,70 +188,57 @@ def test_post_with_compatible_properties(properties, expected):
         (INT64, "", TypeError, "'key' value is of the incorrect type,"),
     ],
 )
-def test_invalid_values_for_int_property(prop_type, value, exception_type, match):
+def test_invalid_values_for_int_property(
+    opened_session, prop_type, value, exception_type, match
+):
     # GIVEN
-    mock = sdk_mock(start=0, openQueueSync=0, post=0, stop=None)
-    session = Session(dummy_callback, _mock=mock)
-    session.open_queue_sync(
-        QUEUE_NAME,
-        write=True,
-        read=False,
-        consumer_priority=0,
-        max_unconfirmed_messages=0,
-        max_unconfirmed_bytes=0,
-    )
+    session, _ = opened_session
     properties = {b"key": (value, prop_type)}
     data = b"Some_message"
 
     # WHEN
-    with pytest.raises(Exception) as exc:
+    with pytest.raises(exception_type, match=match) as exc:
         session.post(QUEUE_NAME, data, properties=properties)
 
     # THEN
     assert exc.type is exception_type
-    assert exc.match(match)
 
 
-@pytest.mark.parametrize(
-    "prop_type, value",
-    [
-        (SHORT, 2**15 - 1),
-        (SHORT, -(2**15)),
-        (INT32, 2**31 - 1),
-        (INT32, -(2**31)),
-        (INT64, 2**63 - 1),
-        (INT64, -(2**63)),
-        (SHORT, True),
-        (SHORT, False),
-        (INT32, True),
-        (INT32, False),
-        (INT64, True),
-        (INT64, False),
-    ],
-)
-def test_valid_values_for_int_property(prop_type, value):
+# Boundary and boolean values accepted by each integer property type
+VALID_INT_PROPERTY_VALUES = [
+    (SHORT, 2**15 - 1),
+    (SHORT, -(2**15)),
+    (INT32, 2**31 - 1),
+    (INT32, -(2**31)),
+    (INT64, 2**63 - 1),
+    (INT64, -(2**63)),
+    (SHORT, True),
+    (SHORT, False),
+    (INT32, True),
+    (INT32, False),
+    (INT64, True),
+    (INT64, False),
+]
+
+
+def test_valid_values_for_int_property(opened_session):
     # GIVEN
-    mock = sdk_mock(start=0, openQueueSync=0, post=0, stop=None)
-    session = Session(dummy_callback, _mock=mock)
-    session.open_queue_sync(
-        QUEUE_NAME,
-        write=True,
-        read=False,
-        consumer_priority=0,
-        max_unconfirmed_messages=0,
-        max_unconfirmed_bytes=0,
-    )
-    properties = {b"key": (value, prop_type)}
-    expected = ({"key": value}, {"key": prop_type})
+    session, mock = opened_session
     data = b"Some_message"
 
-    # WHEN
-    session.post(QUEUE_NAME, data, properties=properties)
+    for prop_type, value in VALID_INT_PROPERTY_VALUES:
+        mock.post.reset_mock()
+        properties = {b"key": (value, prop_type)}
+        expected = ({"key": value}, {"key": prop_type})
 
-    # THEN
-    mock.post.assert_called_once_with(
-        payload=data,
-        queue_uri=QUEUE_NAME,
-        properties=expected,
-        compression_algorithm_type=compression_map.get(CompressionAlgorithmType.NONE),
-    )
+        # WHEN
+        session.post(QUEUE_NAME, data, properties=properties)
+
+        # THEN
+        assert mock.post.call_count == 1, (prop_type, value)
+        assert mock.post.call_args.kwargs == {
+            "payload": data,
+            "queue_uri": QUEUE_NAME,
+            "properties": expected,
+            "compression_algorithm_type": NO_COMPRESSION,
+        }
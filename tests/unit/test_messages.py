@@ -24,98 +24,114 @@ from blazingmq._messages import create_message
 from blazingmq._messages import create_message_handle
 
 from .support import QUEUE_NAME
-from .support import mock
+from .support import RecordingStub
 
+GUID_HEX = "00000F0007D9D17AD0E18C2E7A86E154"
+GUID = bytes.fromhex(GUID_HEX)
 
-def test_create_message():
+# Messages keep a reference to the properties dicts they are given rather than
+# a copy, so the tests sharing these must never modify a message's properties.
+NO_PROPERTIES = {}
+NO_PROPERTY_TYPES = {}
+RAW_MESSAGE = (b"data", b"guid", b"queue_uri", (NO_PROPERTIES, NO_PROPERTY_TYPES))
+
+
+class FakeSession:
+    pass
+
+
+# Shared by every test in the module, none of which modify them
+@pytest.fixture(scope="module")
+def sample_message():
+    return create_message(
+        b"bytes",
+        GUID,
+        "bmq://foo/bar",
+        {"foo": "m"},
+        {"foo": blazingmq.PropertyType.CHAR},
+    )
+
+
+@pytest.fixture(scope="module")
+def sample_ack():
+    return create_ack(GUID, blazingmq.AckStatus.TIMEOUT, "TIMEOUT", "bmq://foo/bar")
+
+
+def test_create_message(sample_message):
     # GIVEN / WHEN
-    data = b"bytes"
-    guid = b"guid"
-    queue_uri = QUEUE_NAME.decode("utf-8")
-    properties = {"foo": "m"}
-    property_types = {"foo": blazingmq.PropertyType.CHAR}
-    m = create_message(data, guid, queue_uri, properties, property_types)
+    m = sample_message
 
     # THEN
-    assert m.data == data
-    assert m.guid == guid
-    assert m.queue_uri == queue_uri
-    assert m.properties["foo"] == properties["foo"]
-    assert m.property_types["foo"] == property_types["foo"]
+    assert m.data == b"bytes"
+    assert m.guid == GUID
+    assert m.queue_uri == "bmq://foo/bar"
+    assert m.properties["foo"] == "m"
+    assert m.property_types["foo"] == blazingmq.PropertyType.CHAR
 
 
 def test_construct_message():
-    # GIVEN
-    # WHEN
-    with pytest.raises(Exception) as exc:
+    # GIVEN / WHEN
+    with pytest.raises(
+        blazingmq.Error, match="^The Message class does not have a public constructor."
+    ) as exc:
         blazingmq.Message()
 
     # THEN
     assert exc.type is blazingmq.Error
-    assert exc.match("^The Message class does not have a public constructor.")
 
 
-def test_message_repr():
-    # GIVEN / WHEN
-    data = b"bytes"
-    guid = b"\x00\x00\x0f\x00\x07\xd9\xd1z\xd0\xe1\x8c.z\x86\xe1T"
-    queue_uri = "bmq://foo/bar"
-    properties = {"foo": "m"}
-    property_types = {"foo": blazingmq.PropertyType.CHAR}
-    m = create_message(data, guid, queue_uri, properties, property_types)
-
-    # THEN
-    assert repr(m) == "<Message[00000F0007D9D17AD0E18C2E7A86E154] for bmq://foo/bar>"
+def test_message_repr(sample_message):
+    # GIVEN / WHEN / THEN
+    assert repr(sample_message) == f"<Message[{GUID_HEX}] for bmq://foo/bar>"
 
 
-def test_create_ack():
+def test_create_ack(sample_ack):
     # GIVEN / WHEN
-    guid = b"guid"
-    status = blazingmq.AckStatus.SUCCESS
-    queue_uri = "bmq://foo/bar"
-    ack = create_ack(guid, status, "SUCCESS", queue_uri)
+    ack = sample_ack
 
     # THEN
-    assert ack.guid == guid
-    assert ack.status == status
-    assert ack.queue_uri == queue_uri
+    assert ack.guid == GUID
+    assert ack.status == blazingmq.AckStatus.TIMEOUT
+    assert ack.queue_uri == "bmq://foo/bar"
 
 
 def test_construct_ack():
-    # GIVEN
-    # WHEN
-    with pytest.raises(Exception) as exc:
+    # GIVEN / WHEN
+    with pytest.raises(
+        blazingmq.Error, match="^The Ack class does not have a public constructor."
+    ) as exc:
         blazingmq.Ack()
 
     # THEN
     assert exc.type is blazingmq.Error
-    assert exc.match("^The Ack class does not have a public constructor.")
 
 
-def test_ack_repr():
-    # GIVEN / WHEN
-    guid = b"\x00\x00\x0f\x00\x07\xd9\xd1z\xd0\xe1\x8c.z\x86\xe1T"
-    queue_uri = "bmq://foo/bar"
-    status = blazingmq.AckStatus.TIMEOUT
-    m = create_ack(guid, status, "TIMEOUT", queue_uri)
+def test_ack_repr(sample_ack):
+    # GIVEN / WHEN / THEN
+    assert repr(sample_ack) == f"<Ack[{GUID_HEX}] TIMEOUT for bmq://foo/bar>"
+
+
+def test_ack_repr_reflects_reassigned_attributes():
+    # GIVEN
+    ack = create_ack(GUID, blazingmq.AckStatus.TIMEOUT, "TIMEOUT", "bmq://foo/bar")
+    repr(ack)
+
+    # WHEN
+    ack.guid = None
+    ack.queue_uri = "bmq://foo/baz"
 
     # THEN
-    assert (
-        repr(m) == "<Ack[00000F0007D9D17AD0E18C2E7A86E154] TIMEOUT for bmq://foo/bar>"
-    )
+    assert repr(ack) == "<Ack TIMEOUT for bmq://foo/baz>"
 
 
 def test_ack_repr_uses_description():
     # GIVEN / WHEN
-    guid = b"\x00\x00\x0f\x00\x07\xd9\xd1z\xd0\xe1\x8c.z\x86\xe1T"
     queue_uri = "bmq://foo/bar"
     status = blazingmq.AckStatus.SUCCESS
-    m = create_ack(guid, status, "TIMEOUT", queue_uri)
+    m = create_ack(GUID, status, "TIMEOUT", queue_uri)
 
     # THEN
-    assert (
-        repr(m) == "<Ack[00000F0007D9D17AD0E18C2E7A86E154] TIMEOUT for bmq://foo/bar>"
-    )
+    assert repr(m) == f"<Ack[{GUID_HEX}] TIMEOUT for bmq://foo/bar>"
 
 
 def test_ack_status_repr():
@@ -142,20 +158,15 @@ def test_type_compression_algorithm_repr():
 
 def test_message_received_in_callback():
     # GIVEN
-    spy = mock.MagicMock()
-
-    class FakeSession:
-        pass
-
+    stub = RecordingStub("on_message")
     ext_session = FakeSession()
-    raw = (b"data", b"guid", b"queue_uri", ({}, {}))
+    raw = RAW_MESSAGE
 
     # WHEN
-    _callbacks.on_message(spy, weakref.ref(ext_session), {}, [raw])
+    _callbacks.on_message(stub.on_message, weakref.ref(ext_session), {}, [raw])
 
     # THEN
-    spy.assert_called_once()
-    args, kwargs = spy.call_args
+    [(args, kwargs)] = stub.calls["on_message"]
     assert not kwargs
     (msg, msg_handle) = args
     assert isinstance(msg, blazingmq.Message)
@@ -165,38 +176,53 @@ def test_message_received_in_callback():
     assert msg.queue_uri == raw[2].decode("utf-8")
 
 
-def test_construct_message_handle():
+def test_messages_in_batch_share_queue_uri():
     # GIVEN
+    stub = RecordingStub("on_message")
+    ext_session = FakeSession()
+    raw1 = (b"data1", b"guid1", b"queue_uri", (NO_PROPERTIES, NO_PROPERTY_TYPES))
+    raw2 = (b"data2", b"guid2", b"queue_uri", (NO_PROPERTIES, NO_PROPERTY_TYPES))
+
     # WHEN
-    with pytest.raises(Exception) as exc:
+    _callbacks.on_message(stub.on_message, weakref.ref(ext_session), {}, [raw1, raw2])
+
+    # THEN
+    ((msg1, _), _), ((msg2, _), _) = stub.calls["on_message"]
+    assert msg1.queue_uri == "queue_uri"
+    assert msg1.queue_uri is msg2.queue_uri
+
+
+def test_construct_message_handle():
+    # GIVEN / WHEN
+    with pytest.raises(
+        blazingmq.Error,
+        match="^The MessageHandle class does not have a public constructor.",
+    ) as exc:
         blazingmq.MessageHandle()
 
     # THEN
     assert exc.type is blazingmq.Error
-    assert exc.match("^The MessageHandle class does not have a public constructor.")
 
 
-def test_message_repr_context():
-    guid = bytes.fromhex("00000F0007D9D17AD0E18C2E7A86E154")
-    queue_uri = "bmq://foo/bar"
-    message = create_message(b"bytes", guid, queue_uri, {}, {})
+def test_message_repr_context(sample_message):
     ext_session = object()
-    msg_handle = create_message_handle(message, ext_session)
+    msg_handle = create_message_handle(sample_message, ext_session)
 
     # THEN
-    expected = "<MessageHandle[00000F0007D9D17AD0E18C2E7A86E154] for bmq://foo/bar>"
+    expected = f"<MessageHandle[{GUID_HEX}] for bmq://foo/bar>"
     assert repr(msg_handle) == expected
 
 
 def test_call_confirm_on_message_handle():
     # GIVEN / WHEN
-    message = create_message(b"bytes", b"guid", QUEUE_NAME.decode("utf-8"), {}, {})
-    ext_session = mock.MagicMock()
-    ext_session.mock_add_spec(["confirm"])
+    message = create_message(
+        b"bytes", b"guid", QUEUE_NAME.decode("utf-8"), NO_PROPERTIES, NO_PROPERTY_TYPES
+    )
+    ext_session = RecordingStub("confirm")
     msg_handle = create_message_handle(message, ext_session)
 
     # WHEN
     msg_handle.confirm()
 
     # THEN
-    ext_session.confirm.assert_called_with(message)
+    assert ext_session.calls["confirm"] == [((message,), {})]
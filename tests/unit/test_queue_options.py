@@ -17,6 +17,17 @@ import pytest
 
 import blazingmq
 
+EXPECTED_QUEUE_OPTIONS_REPR = (
+    "QueueOptions("
+    "max_unconfirmed_messages=10,"
+    " max_unconfirmed_bytes=1,"
+    " consumer_priority=100,"
+    " suspends_on_bad_host_health=False)"
+)
+
+# Shared by the comparison tests, which never modify it
+DEFAULT_OPTIONS = blazingmq.QueueOptions()
+
 
 def test_queue_options_repr():
     # WHEN
@@ -27,13 +38,7 @@ def test_queue_options_repr():
         suspends_on_bad_host_health=False,
     )
     # THEN
-    assert (
-        "QueueOptions("
-        "max_unconfirmed_messages=10,"
-        " max_unconfirmed_bytes=1,"
-        " consumer_priority=100,"
-        " suspends_on_bad_host_health=False)" == repr(one)
-    )
+    assert EXPECTED_QUEUE_OPTIONS_REPR == repr(one)
 
 
 def test_queue_options_default_repr():
@@ -55,7 +60,7 @@ def test_queue_options_default_to_none():
 
 def test_queue_options_equality():
     # GIVEN
-    left = blazingmq.QueueOptions()
+    left = DEFAULT_OPTIONS
 
     # WHEN
     right = blazingmq.QueueOptions()
@@ -66,18 +71,19 @@ def test_queue_options_equality():
 
 
 @pytest.mark.parametrize(
-    "right",
+    "make_right",
     [
-        None,
-        "string",
-        blazingmq.QueueOptions(max_unconfirmed_messages=1),
-        blazingmq.QueueOptions(max_unconfirmed_bytes=1),
-        blazingmq.QueueOptions(consumer_priority=1),
+        lambda: None,
+        lambda: "string",
+        lambda: blazingmq.QueueOptions(max_unconfirmed_messages=1),
+        lambda: blazingmq.QueueOptions(max_unconfirmed_bytes=1),
+        lambda: blazingmq.QueueOptions(consumer_priority=1),
     ],
 )
-def test_queue_options_other_inequality(right):
+def test_queue_options_other_inequality(make_right):
     # GIVEN
-    left = blazingmq.QueueOptions()
+    left = DEFAULT_OPTIONS
+    right = make_right()
 
     # THEN
     assert not left == right
@@ -13,8 +13,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import re
-
 import pytest
 
 from blazingmq import BasicHealthMonitor
@@ -29,21 +27,42 @@ from blazingmq._session import DEFAULT_TIMEOUT
 from blazingmq.testing import HostHealth
 
 from .support import dummy_callback
-from .support import make_session
-from .support import mock
+
+SUSPENSION_WITHOUT_MONITORING_MESSAGE = (
+    "Queues cannot use suspends_on_bad_host_health if host"
+    " health monitoring was disabled when the Session was created"
+)
+
+# Keyword arguments passed to the extension session when a queue is opened or
+# configured without any options
+CONFIGURE_DEFAULTS = {
+    "consumer_priority": None,
+    "max_unconfirmed_messages": None,
+    "max_unconfirmed_bytes": None,
+    "suspends_on_bad_host_health": None,
+    "timeout": None,
+}
+OPEN_DEFAULTS = {"write": False, "read": False, **CONFIGURE_DEFAULTS}
+CUSTOM_QUEUE_OPTIONS = {
+    "max_unconfirmed_messages": 100,
+    "max_unconfirmed_bytes": 2048,
+    "consumer_priority": 5,
+    "suspends_on_bad_host_health": False,
+}
+
+
+def dummy1():
+    pass
+
+
+def dummy2():
+    pass
 
 
-@mock.patch("blazingmq._session.ExtSession")
 def test_session_constructed(ext_cls):
     # GIVEN
     ext_cls.mock_add_spec([])
 
-    def dummy1():
-        pass
-
-    def dummy2():
-        pass
-
     # WHEN
     Session(
         dummy1,
@@ -81,17 +100,10 @@ def test_session_constructed(ext_cls):
     )
 
 
-@mock.patch("blazingmq._session.ExtSession")
 def test_session_constructed_with_timeouts(ext_cls):
     # GIVEN
     ext_cls.mock_add_spec([])
 
-    def dummy1():
-        pass
-
-    def dummy2():
-        pass
-
     timeouts = Timeouts(
         connect_timeout=60.0,
         disconnect_timeout=70.0,
@@ -131,17 +143,10 @@ def test_session_constructed_with_timeouts(ext_cls):
     )
 
 
-@mock.patch("blazingmq._session.ExtSession")
 def test_session_constructed_with_default_timeouts(ext_cls):
     # GIVEN
     ext_cls.mock_add_spec([])
 
-    def dummy1():
-        pass
-
-    def dummy2():
-        pass
-
     timeouts = Timeouts()
 
     # WHEN
@@ -175,17 +180,10 @@ def test_session_constructed_with_default_timeouts(ext_cls):
     )
 
 
-@mock.patch("blazingmq._session.ExtSession")
 def test_session_default_with_options(ext_cls):
     # GIVEN
     ext_cls.mock_add_spec([])
 
-    def dummy1():
-        pass
-
-    def dummy2():
-        pass
-
     session_options = SessionOptions()
 
     # WHEN
@@ -210,17 +208,10 @@ def test_session_default_with_options(ext_cls):
     )
 
 
-@mock.patch("blazingmq._session.ExtSession")
 def test_session_with_options(ext_cls):
     # GIVEN
     ext_cls.mock_add_spec([])
 
-    def dummy1():
-        pass
-
-    def dummy2():
-        pass
-
     timeouts = Timeouts(
         connect_timeout=60.0,
         disconnect_timeout=70.0,
@@ -262,17 +253,10 @@ def test_session_with_options(ext_cls):
     )
 
 
-@mock.patch("blazingmq._session.ExtSession")
 def test_session_basic_monitor(ext_cls):
     # GIVEN
     ext_cls.mock_add_spec([])
 
-    def dummy1():
-        pass
-
-    def dummy2():
-        pass
-
     monitor = BasicHealthMonitor()
 
     # WHEN
@@ -307,17 +291,10 @@ def test_session_basic_monitor(ext_cls):
     )
 
 
-@mock.patch("blazingmq._session.ExtSession")
 def test_session_default_constructed(ext_cls):
     # GIVEN
     ext_cls.mock_add_spec([])
 
-    def dummy1():
-        pass
-
-    def dummy2():
-        pass
-
     # WHEN
     Session(dummy1, dummy2)
 
@@ -338,50 +315,35 @@ def test_session_default_constructed(ext_cls):
     )
 
 
-@mock.patch("blazingmq._session.ExtSession")
 def test_constructing_with_bad_type_for_host_health_monitor(ext_cls):
     # GIVEN
     ext_cls.mock_add_spec([])
 
-    def dummy1():
-        pass
-
-    def dummy2():
-        pass
-
     # WHEN
-    with pytest.raises(Exception) as exc:
+    with pytest.raises(
+        TypeError,
+        match=r"host_health_monitor must be None or an instance of blazingmq\.",
+    ) as exc:
         Session(dummy1, dummy2, host_health_monitor="yes")
 
     # THEN
     assert exc.type is TypeError
-    assert exc.match(r"host_health_monitor must be None or an instance of blazingmq\.")
 
 
-def test_session_open_queue(ext):
+def test_session_open_queue(ext, session):
     # GIVEN
     ext.mock_add_spec(["open_queue_sync"])
-    session = make_session()
     timeout = 60.0
     queue_uri = "queue_uri"
     read = True
     write = False
-    max_unconfirmed_messages = 100
-    max_unconfirmed_bytes = 2048
-    consumer_priority = 5
-    suspends_on_bad_host_health = False
 
     # WHEN
     session.open_queue(
         queue_uri,
         write=write,
         read=read,
-        options=QueueOptions(
-            max_unconfirmed_messages=max_unconfirmed_messages,
-            max_unconfirmed_bytes=max_unconfirmed_bytes,
-            consumer_priority=consumer_priority,
-            suspends_on_bad_host_health=suspends_on_bad_host_health,
-        ),
+        options=QueueOptions(**CUSTOM_QUEUE_OPTIONS),
         timeout=timeout,
     )
 
@@ -390,33 +352,20 @@ def test_session_open_queue(ext):
         b"queue_uri",
         write=write,
         read=read,
-        max_unconfirmed_messages=max_unconfirmed_messages,
-        max_unconfirmed_bytes=max_unconfirmed_bytes,
-        consumer_priority=consumer_priority,
+        **CUSTOM_QUEUE_OPTIONS,
         timeout=timeout,
-        suspends_on_bad_host_health=suspends_on_bad_host_health,
     )
 
 
-def test_session_open_queue_defaults(ext):
+def test_session_open_queue_defaults(ext, session):
     # GIVEN
     ext.mock_add_spec(["open_queue_sync"])
-    session = make_session()
 
     # WHEN
     session.open_queue("queue_uri")
 
     # THEN
-    ext.open_queue_sync.assert_called_once_with(
-        b"queue_uri",
-        write=False,
-        read=False,
-        consumer_priority=None,
-        max_unconfirmed_messages=None,
-        max_unconfirmed_bytes=None,
-        suspends_on_bad_host_health=None,
-        timeout=None,
-    )
+    ext.open_queue_sync.assert_called_once_with(b"queue_uri", **OPEN_DEFAULTS)
 
 
 def test_session_open_queue_for_read_no_on_message_raises(ext):
@@ -425,41 +374,36 @@ def test_session_open_queue_for_read_no_on_message_raises(ext):
     session = Session(dummy_callback)
 
     # WHEN
-    with pytest.raises(Exception) as exc:
+    with pytest.raises(Error) as exc:
         session.open_queue("queue_uri", read=True)
 
     # THEN
     assert exc.type is Error
-    assert exc.match(
+    assert str(exc.value) == (
         "Can't open queue queue_uri in read mode: no "
         "on_message callback was provided at Session construction"
     )
 
 
-def test_session_open_with_suspension_without_health_monitoring(ext):
+def test_session_open_with_suspension_without_health_monitoring(ext, session):
     # GIVEN
     ext.mock_add_spec(["open_queue_sync", "monitor_host_health"])
     ext.monitor_host_health = False
-    session = make_session()
     queue_uri = "queue_uri"
     options = QueueOptions(suspends_on_bad_host_health=True)
 
     # WHEN
-    with pytest.raises(Exception) as exc:
+    with pytest.raises(Error) as exc:
         session.open_queue(queue_uri, write=True, options=options)
 
     # THEN
     assert exc.type is Error
-    assert exc.match(
-        r"Queues cannot use suspends_on_bad_host_health if host"
-        r" health monitoring was disabled when the Session was created"
-    )
+    assert str(exc.value) == SUSPENSION_WITHOUT_MONITORING_MESSAGE
 
 
-def test_session_close_queue(ext):
+def test_session_close_queue(ext, session):
     # GIVEN
     ext.mock_add_spec(["close_queue_sync"])
-    session = make_session()
     queue_uri = "queue_uri"
     timeout = 60.0
 
@@ -473,84 +417,54 @@ def test_session_close_queue(ext):
     )
 
 
-def test_session_configure_queue(ext):
+def test_session_configure_queue(ext, session):
     # GIVEN
     ext.mock_add_spec(["configure_queue_sync"])
-    session = make_session()
     queue_uri = "queue_uri"
     timeout = 60.0
-    max_unconfirmed_messages = 100
-    max_unconfirmed_bytes = 2048
-    consumer_priority = 5
-    suspends_on_bad_host_health = False
 
     # WHEN
     session.configure_queue(
-        queue_uri,
-        options=QueueOptions(
-            max_unconfirmed_messages=max_unconfirmed_messages,
-            max_unconfirmed_bytes=max_unconfirmed_bytes,
-            consumer_priority=consumer_priority,
-            suspends_on_bad_host_health=suspends_on_bad_host_health,
-        ),
-        timeout=timeout,
+        queue_uri, options=QueueOptions(**CUSTOM_QUEUE_OPTIONS), timeout=timeout
     )
 
     # THEN
     ext.configure_queue_sync.assert_called_once_with(
-        b"queue_uri",
-        max_unconfirmed_messages=max_unconfirmed_messages,
-        max_unconfirmed_bytes=max_unconfirmed_bytes,
-        consumer_priority=consumer_priority,
-        suspends_on_bad_host_health=suspends_on_bad_host_health,
-        timeout=timeout,
+        b"queue_uri", **CUSTOM_QUEUE_OPTIONS, timeout=timeout
     )
 
 
-def test_session_configure_queue_defaults(ext):
+def test_session_configure_queue_defaults(ext, session):
     # GIVEN
     ext.mock_add_spec(["configure_queue_sync"])
-    session = make_session()
     queue_uri = "queue_uri"
 
     # WHEN
     session.configure_queue(queue_uri, options=QueueOptions())
 
     # THEN
-    ext.configure_queue_sync.assert_called_once_with(
-        b"queue_uri",
-        consumer_priority=None,
-        max_unconfirmed_messages=None,
-        max_unconfirmed_bytes=None,
-        suspends_on_bad_host_health=None,
-        timeout=None,
-    )
+    ext.configure_queue_sync.assert_called_once_with(b"queue_uri", **CONFIGURE_DEFAULTS)
 
 
-def test_session_configure_suspension_without_health_monitoring(ext):
+def test_session_configure_suspension_without_health_monitoring(ext, session):
     # GIVEN
     ext.mock_add_spec(["configure_queue_sync", "monitor_host_health"])
     ext.monitor_host_health = False
-    session = make_session()
     queue_uri = "queue_uri"
     options = QueueOptions(suspends_on_bad_host_health=True)
 
     # WHEN
-    with pytest.raises(Exception) as exc:
+    with pytest.raises(Error) as exc:
         session.configure_queue(queue_uri, options=options)
 
     # THEN
     assert exc.type is Error
-    assert exc.match(
-        r"Queues cannot use suspends_on_bad_host_health if host"
-        r" health monitoring was disabled when the Session was created"
-    )
+    assert str(exc.value) == SUSPENSION_WITHOUT_MONITORING_MESSAGE
 
 
-def test_session_stop(ext):
+def test_session_stop(ext, session):
     # GIVEN
     ext.mock_add_spec(["stop"])
-    session = make_session()
 
     # WHEN
     session.stop()
@@ -559,10 +473,9 @@ def test_session_stop(ext):
     ext.stop.assert_called_once_with()
 
 
-def test_session_post_no_ack_no_properties(ext):
+def test_session_post_no_ack_no_properties(ext, session):
     # GIVEN
     ext.mock_add_spec(["post"])
-    session = make_session()
 
     # WHEN
     session.post(
@@ -579,30 +492,25 @@ def test_session_post_no_ack_no_properties(ext):
     )
 
 
-def test_session_post_with_ack(ext):
+def test_session_post_with_ack(ext, session):
     # GIVEN
     ext.mock_add_spec(["post"])
-    session = make_session()
-
-    def dummy():
-        pass
 
     # WHEN
-    session.post("queue_uri", b"data", on_ack=dummy)
+    session.post("queue_uri", b"data", on_ack=dummy1)
 
     # THEN
     ext.post.assert_called_once_with(
         b"queue_uri",
         b"data",
         properties=None,
-        on_ack=dummy,
+        on_ack=dummy1,
     )
 
 
-def test_session_confirm(ext):
+def test_session_confirm(ext, session):
     # GIVEN
     ext.mock_add_spec(["confirm"])
-    session = make_session()
     msg = create_message(b"data", b"guid", "queue_uri", {}, {})
 
     # WHEN
@@ -612,10 +520,9 @@ def test_session_confirm(ext):
     ext.confirm.assert_called_once_with(msg)
 
 
-def test_session_as_context_manager(ext):
+def test_session_as_context_manager(ext, session):
     # GIVEN
     ext.mock_add_spec(["stop"])
-    session = make_session()
 
     # WHEN
     with session:
@@ -625,111 +532,83 @@ def test_session_as_context_manager(ext):
     ext.stop.assert_called_once_with()
 
 
-@pytest.mark.parametrize("timeout", [-1.0, 2.0**63, float("inf")])
-def test_session_bad_timeout(timeout):
-    # GIVEN
-    def dummy():
-        pass
-
-    expected_pat = re.escape(f"timeout must be greater than 0.0, was {timeout}")
-
-    # WHEN
-    with pytest.raises(Exception) as exc:
-        Session(dummy, on_message=dummy, broker="some_uri", timeout=timeout)
-
-    # THEN
-    assert exc.type is ValueError
-    assert exc.match(expected_pat)
-
-
-@mock.patch("blazingmq._session.ExtSession")
-@pytest.mark.parametrize("timeout", [-1.0, 0.0, 2.0**63, float("inf")])
-def test_session_open_queue_bad_timeout(ext_cls, timeout):
-    # GIVEN
-    def dummy():
-        pass
-
-    expected_pat = re.escape(f"timeout must be greater than 0.0, was {timeout}")
-    ext_cls.mock_add_spec([])
-    session = Session(dummy, on_message=dummy, broker="some_uri")
-
-    # WHEN
-    with pytest.raises(Exception) as exc:
-        session.open_queue("dummy uri", timeout=timeout)
-
-    # THEN
-    assert exc.type is ValueError
-    assert exc.match(expected_pat)
-
-
-@mock.patch("blazingmq._session.ExtSession")
-@pytest.mark.parametrize("timeout", [-1.0, 0.0, 2.0**63, float("inf")])
-def test_session_configure_queue_bad_timeout(ext_cls, timeout):
-    # GIVEN
-
-    def dummy():
-        pass
+def bad_value_params(message_format, values):
+    """Pair each bad value with the error message it should raise."""
+    return [
+        pytest.param(value, message_format.format(value), id=str(value))
+        for value in values
+    ]
 
-    expected_pat = re.escape(f"timeout must be greater than 0.0, was {timeout}")
-    dummy_uri = "dummy uri"
-    ext_cls.mock_add_spec([])
-    session = Session(dummy, on_message=dummy, broker="some_uri")
-    session.open_queue(dummy_uri, read=True)
 
-    # WHEN
-    with pytest.raises(Exception) as exc:
-        session.configure_queue("dummy uri", options=QueueOptions(), timeout=timeout)
+@pytest.mark.parametrize(
+    "timeout, expected_message",
+    bad_value_params(
+        "timeout must be greater than 0.0, was {}", [-1.0, 2.0**63, float("inf")]
+    ),
+)
+def test_session_bad_timeout(timeout, expected_message):
+    # GIVEN / WHEN
+    with pytest.raises(ValueError) as exc:
+        Session(dummy1, on_message=dummy1, broker="some_uri", timeout=timeout)
 
     # THEN
     assert exc.type is ValueError
-    assert exc.match(expected_pat)
-
-
-@mock.patch("blazingmq._session.ExtSession")
-@pytest.mark.parametrize("timeout", [-1.0, 0.0, 2.0**63, float("inf")])
-def test_session_close_queue_bad_timeout(ext_cls, timeout):
+    assert str(exc.value) == expected_message
+
+
+# Extra arguments for each queue method taking a `timeout`
+QUEUE_METHOD_KWARGS = {
+    "open_queue": {},
+    "configure_queue": {"options": QueueOptions()},
+    "close_queue": {},
+}
+
+
+@pytest.mark.parametrize(
+    "timeout, expected_message",
+    bad_value_params(
+        "timeout must be greater than 0.0, was {}",
+        [-1.0, 0.0, 2.0**63, float("inf")],
+    ),
+)
+@pytest.mark.parametrize("method", list(QUEUE_METHOD_KWARGS))
+def test_session_queue_method_bad_timeout(session, method, timeout, expected_message):
     # GIVEN
-
-    def dummy():
-        pass
-
-    expected_pat = re.escape(f"timeout must be greater than 0.0, was {timeout}")
     dummy_uri = "dummy uri"
-    ext_cls.mock_add_spec([])
-    session = Session(dummy, on_message=dummy, broker="some_uri")
-    session.open_queue(dummy_uri, read=True)
+    if method != "open_queue":
+        session.open_queue(dummy_uri, read=True)
 
     # WHEN
-    with pytest.raises(Exception) as exc:
-        session.close_queue("dummy uri", timeout=timeout)
+    with pytest.raises(ValueError) as exc:
+        getattr(session, method)(
+            dummy_uri, **QUEUE_METHOD_KWARGS[method], timeout=timeout
+        )
 
     # THEN
     assert exc.type is ValueError
-    assert exc.match(expected_pat)
-
-
-@pytest.mark.parametrize("stats_dump_interval", [-1.0, 2.0**63, float("inf")])
-def test_session_bad_stats_dump_interval(stats_dump_interval):
-    # GIVEN
-    def dummy():
-        pass
-
-    expected_pat = re.escape(
-        f"stats_dump_interval must be nonnegative, was {stats_dump_interval}"
-    )
-
-    # WHEN
-    with pytest.raises(Exception) as exc:
+    assert str(exc.value) == expected_message
+
+
+@pytest.mark.parametrize(
+    "stats_dump_interval, expected_message",
+    bad_value_params(
+        "stats_dump_interval must be nonnegative, was {}",
+        [-1.0, 2.0**63, float("inf")],
+    ),
+)
+def test_session_bad_stats_dump_interval(stats_dump_interval, expected_message):
+    # GIVEN / WHEN
+    with pytest.raises(ValueError) as exc:
         Session(
-            dummy,
-            on_message=dummy,
+            dummy1,
+            on_message=dummy1,
             broker="some_uri",
             stats_dump_interval=stats_dump_interval,
         )
 
     # THEN
     assert exc.type is ValueError
-    assert exc.match(expected_pat)
+    assert str(exc.value) == expected_message
 
 
 def test_default_timeout_repr():
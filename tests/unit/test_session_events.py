@@ -18,15 +18,18 @@ import logging
 import pytest
 
 from blazingmq import _callbacks
-from blazingmq import _ext
 from blazingmq import session_events
+from blazingmq._ext import SESSION_EVENT_TYPE_MAPPING
 
 from .support import mock
 
+CONNECTED = session_events.Connected(None)
+DISCONNECTED = session_events.Disconnected(None)
+
 
 def test_session_event_comparison():
     # GIVEN / WHEN
-    a = session_events.Connected(None)
+    a = CONNECTED
 
     # THEN
     assert a == session_events.Connected(None)
@@ -35,81 +38,93 @@ def test_session_event_comparison():
     assert a != session_events.Connected("Not a None")
 
 
-def test_interface_error_repr():
-    # GIVEN / WHEN
-    error = "Unexpected event type: Timeout"
-    e = session_events.InterfaceError(error)
-
-    # THEN
-    assert repr(e) == "<InterfaceError: Unexpected event type: Timeout>"
-
-
-def test_interface_error_non_ascii_str():
-    # GIVEN / WHEN
-    error = "Unexpected event type: \u2014 Timeout"
-    e = session_events.InterfaceError(error)
-
-    # THEN
-    r = repr(e)
-    if isinstance(r, bytes):
-        assert r == "<InterfaceError: Unexpected event type: \xe2\x80\x94 Timeout>"
-    else:
-        assert r == "<InterfaceError: Unexpected event type: \u2014 Timeout>"
-
-
-def test_connected_repr():
-    # GIVEN / WHEN
-    e = session_events.Connected(None)
-
-    # THEN
-    assert repr(e) == "<Connected>"
-
-
-def test_queue_reopened_repr():
-    # GIVEN / WHEN
-    e = session_events.QueueReopened("bmq://dummy_queue")
-
-    # THEN
-    assert repr(e) == "<QueueReopened: bmq://dummy_queue>"
-
-
-def test_queue_reopened_eq():
-    # GIVEN / WHEN
-    e = session_events.QueueReopened("bmq://dummy_queue")
-
-    # THEN
-    assert e == session_events.QueueReopened("bmq://dummy_queue")
-    assert e != session_events.QueueReopened("bmq://other_queue")
-    assert e != session_events.Connected(None)
-
-
-def test_queue_reopen_failed_repr():
-    # GIVEN / WHEN
-    e = session_events.QueueReopenFailed("bmq://dummy_queue", "Failed to reopen")
-
-    # THEN
-    assert repr(e) == "<QueueReopenFailed: bmq://dummy_queue Failed to reopen>"
-
+@pytest.mark.parametrize(
+    "event, expected_repr",
+    [
+        (
+            session_events.InterfaceError("Unexpected event type: Timeout"),
+            "<InterfaceError: Unexpected event type: Timeout>",
+        ),
+        (
+            session_events.InterfaceError("Unexpected event type: \u2014 Timeout"),
+            "<InterfaceError: Unexpected event type: \u2014 Timeout>",
+        ),
+        (CONNECTED, "<Connected>"),
+        (
+            session_events.QueueReopened("bmq://dummy_queue"),
+            "<QueueReopened: bmq://dummy_queue>",
+        ),
+        (
+            session_events.QueueReopenFailed("bmq://dummy_queue", "Failed to reopen"),
+            "<QueueReopenFailed: bmq://dummy_queue Failed to reopen>",
+        ),
+    ],
+    ids=[
+        "interface_error",
+        "interface_error_non_ascii",
+        "connected",
+        "queue_reopened",
+        "queue_reopen_failed",
+    ],
+)
+def test_session_event_repr(event, expected_repr):
+    # GIVEN / WHEN / THEN
+    assert repr(event) == expected_repr
 
-def test_queue_reopen_failed_eq():
-    # GIVEN / WHEN
-    e = session_events.QueueReopenFailed("bmq://dummy_queue", "Failed to reopen")
 
-    # THEN
-    assert e == session_events.QueueReopenFailed(
-        "bmq://dummy_queue", "Failed to reopen"
-    )
-    assert e != session_events.QueueReopenFailed("bmq://dummy_queue", "Other reason")
-    assert e != session_events.QueueReopenFailed(
-        "bmq://other_queue", "Failed to reopen"
-    )
-    assert e != session_events.Connected(None)
+@pytest.mark.parametrize(
+    "lhs, rhs, should_equal",
+    [
+        (
+            session_events.QueueReopened("bmq://dummy_queue"),
+            session_events.QueueReopened("bmq://dummy_queue"),
+            True,
+        ),
+        (
+            session_events.QueueReopened("bmq://dummy_queue"),
+            session_events.QueueReopened("bmq://other_queue"),
+            False,
+        ),
+        (
+            session_events.QueueReopened("bmq://dummy_queue"),
+            CONNECTED,
+            False,
+        ),
+        (
+            session_events.QueueReopenFailed("bmq://dummy_queue", "Failed to reopen"),
+            session_events.QueueReopenFailed("bmq://dummy_queue", "Failed to reopen"),
+            True,
+        ),
+        (
+            session_events.QueueReopenFailed("bmq://dummy_queue", "Failed to reopen"),
+            session_events.QueueReopenFailed("bmq://dummy_queue", "Other reason"),
+            False,
+        ),
+        (
+            session_events.QueueReopenFailed("bmq://dummy_queue", "Failed to reopen"),
+            session_events.QueueReopenFailed("bmq://other_queue", "Failed to reopen"),
+            False,
+        ),
+        (
+            session_events.QueueReopenFailed("bmq://dummy_queue", "Failed to reopen"),
+            CONNECTED,
+            False,
+        ),
+    ],
+)
+def test_queue_event_eq(lhs, rhs, should_equal):
+    # GIVEN / WHEN / THEN
+    assert (lhs == rhs) is should_equal
+    assert (lhs != rhs) is not should_equal
 
 
 @pytest.mark.parametrize(
-    "event_type, event_name, status_code, status_name, uri, error_description, expected_event",
+    (
+        "event_type, event_name, status_code, status_name, uri, error_description,"
+        " expected_type, expected_args"
+    ),
     [
-        (1, b"Connected", 0, b"SUCCESS", "", b"", session_events.Connected(None)),
+        (1, b"Connected", 0, b"SUCCESS", "", b"", session_events.Connected, (None,)),
         (
             2,
             b"Disconnected",
@@ -117,7 +132,8 @@ def test_queue_reopen_failed_eq():
             b"SUCCESS",
             "",
             b"",
-            session_events.Disconnected(None),
+            session_events.Disconnected,
+            (None,),
         ),
         (
             3,
@@ -126,9 +142,19 @@ def test_queue_reopen_failed_eq():
             b"SUCCESS",
             "",
             b"",
-            session_events.ConnectionLost(None),
+            session_events.ConnectionLost,
+            (None,),
+        ),
+        (
+            4,
+            b"Reconnected",
+            0,
+            b"SUCCESS",
+            b"",
+            b"",
+            session_events.Reconnected,
+            (None,),
         ),
-        (4, b"Reconnected", 0, b"SUCCESS", b"", b"", session_events.Reconnected(None)),
         (
             5,
             b"StateRestored",
@@ -136,7 +162,8 @@ def test_queue_reopen_failed_eq():
             b"SUCCESS",
             "",
             b"",
-            session_events.StateRestored(None),
+            session_events.StateRestored,
+            (None,),
         ),
         (
             6,
@@ -145,7 +172,8 @@ def test_queue_reopen_failed_eq():
             b"SUCCESS",
             "",
             b"",
-            session_events.ConnectionTimeout(None),
+            session_events.ConnectionTimeout,
+            (None,),
         ),
         (
             8,
@@ -154,7 +182,8 @@ def test_queue_reopen_failed_eq():
             b"SUCCESS",
             "bmq://dummy_queue",
             b"",
-            session_events.QueueReopened("bmq://dummy_queue"),
+            session_events.QueueReopened,
+            ("bmq://dummy_queue",),
         ),
         (
             8,
@@ -163,9 +192,8 @@ def test_queue_reopen_failed_eq():
             b"NOT_SUCCESS",
             "bmq://dummy_queue",
             b"Error message",
-            session_events.QueueReopenFailed(
-                "bmq://dummy_queue", "Error message: NOT_SUCCESS (1)"
-            ),
+            session_events.QueueReopenFailed,
+            ("bmq://dummy_queue", "Error message: NOT_SUCCESS (1)"),
         ),
         (
             10,
@@ -174,7 +202,8 @@ def test_queue_reopen_failed_eq():
             b"SUCCESS",
             "",
             b"",
-            session_events.SlowConsumerNormal(None),
+            session_events.SlowConsumerNormal,
+            (None,),
         ),
         (
             11,
@@ -183,7 +212,8 @@ def test_queue_reopen_failed_eq():
             b"SUCCESS",
             "",
             b"",
-            session_events.SlowConsumerHighWaterMark(None),
+            session_events.SlowConsumerHighWaterMark,
+            (None,),
         ),
         (
             -1,
@@ -192,7 +222,8 @@ def test_queue_reopen_failed_eq():
             b"NOT_SUCCESS",
             "",
             b"Error message",
-            session_events.Error("Error message: NOT_SUCCESS (42)"),
+            session_events.Error,
+            ("Error message: NOT_SUCCESS (42)",),
         ),
         (
             777,
@@ -201,7 +232,8 @@ def test_queue_reopen_failed_eq():
             b"NOT_SUCCESS",
             "",
             b"Error message",
-            session_events.InterfaceError("Unexpected event type: Abracadabra"),
+            session_events.InterfaceError,
+            ("Unexpected event type: Abracadabra",),
         ),
     ],
 )
@@ -212,15 +244,17 @@ def test_translating_sdk_session_events(
     status_name,
     uri,
     error_description,
-    expected_event,
+    expected_type,
+    expected_args,
 ):
     # GIVEN
     spy = mock.MagicMock()
+    expected_event = expected_type(*expected_args)
 
     # WHEN
     _callbacks.on_session_event(
         spy,
-        _ext.SESSION_EVENT_TYPE_MAPPING,
+        SESSION_EVENT_TYPE_MAPPING,
         error_description,
         (event_type, event_name, status_code, status_name, uri),
     )
@@ -238,7 +272,7 @@ def test_generating_interface_errors_without_an_sdk_event():
     # WHEN
     _callbacks.on_session_event(
         spy,
-        _ext.SESSION_EVENT_TYPE_MAPPING,
+        SESSION_EVENT_TYPE_MAPPING,
         b"some error message",
     )
 
@@ -248,36 +282,44 @@ def test_generating_interface_errors_without_an_sdk_event():
     assert args == (session_events.InterfaceError("some error message"),)
 
 
+@pytest.fixture()
+def debug_caplog(caplog):
+    caplog.set_level(logging.DEBUG, logger=session_events.LOGGER.name)
+    return caplog
+
+
+# Each event with the name of the level it is logged at
+LOGGED_EVENTS = [
+    (CONNECTED, "INFO"),
+    (DISCONNECTED, "INFO"),
+    (session_events.ConnectionLost(None), "WARN"),
+    (session_events.Reconnected(None), "WARN"),
+    (session_events.StateRestored(None), "INFO"),
+    (session_events.ConnectionTimeout(None), "ERROR"),
+    (session_events.SlowConsumerNormal(None), "INFO"),
+    (session_events.SlowConsumerHighWaterMark(None), "WARN"),
+    (session_events.Error("Error message: NOT_SUCCESS (42)"), "ERROR"),
+    (session_events.QueueReopened("bmq://dummy_queue"), "INFO"),
+    (
+        session_events.QueueReopenFailed("bmq://dummy_queue", "Failed to reopen"),
+        "ERROR",
+    ),
+    (session_events.InterfaceError("Unexpected event type: Abracadabra"), "ERROR"),
+]
+
+
 @pytest.mark.parametrize(
-    "event, expected_level_name",
+    "event, expected_level, expected_message",
     [
-        (session_events.Connected(None), "INFO"),
-        (session_events.Disconnected(None), "INFO"),
-        (session_events.ConnectionLost(None), "WARN"),
-        (session_events.Reconnected(None), "WARN"),
-        (session_events.StateRestored(None), "INFO"),
-        (session_events.ConnectionTimeout(None), "ERROR"),
-        (session_events.SlowConsumerNormal(None), "INFO"),
-        (session_events.SlowConsumerHighWaterMark(None), "WARN"),
-        (session_events.Error("Error message: NOT_SUCCESS (42)"), "ERROR"),
-        (session_events.QueueReopened("bmq://dummy_queue"), "INFO"),
-        (
-            session_events.QueueReopenFailed("bmq://dummy_queue", "Failed to reopen"),
-            "ERROR",
-        ),
-        (session_events.InterfaceError("Unexpected event type: Abracadabra"), "ERROR"),
+        (event, getattr(logging, level_name), f"Received session event: {event}")
+        for event, level_name in LOGGED_EVENTS
     ],
 )
-def test_log_session_event(event, expected_level_name, caplog):
-    # GIVEN
-    expected_level = getattr(logging, expected_level_name)
-    expected_message = "Received session event: " + str(event)
-    caplog.set_level(logging.DEBUG)
-
-    # WHEN
+def test_log_session_event(event, expected_level, expected_message, debug_caplog):
+    # GIVEN / WHEN
     session_events.log_session_event(event)
 
     # THEN
-    assert caplog.record_tuples == [
+    assert debug_caplog.record_tuples == [
         ("blazingmq.session_events", expected_level, expected_message)
     ]
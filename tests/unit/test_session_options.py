@@ -17,6 +17,21 @@ import pytest
 
 import blazingmq
 
+EXPECTED_SESSION_OPTIONS_REPR = (
+    "SessionOptions("
+    "message_compression_algorithm=<CompressionAlgorithmType.ZLIB>,"
+    " timeouts=Timeouts(),"
+    " host_health_monitor=BasicHealthMonitor(),"
+    " num_processing_threads=1,"
+    " blob_buffer_size=5000,"
+    " channel_high_watermark=8000000,"
+    " event_queue_watermarks=(6000000, 7000000),"
+    " stats_dump_interval=30.0)"
+)
+
+# Shared by the comparison tests, which never modify it
+DEFAULT_OPTIONS = blazingmq.SessionOptions()
+
 
 def test_session_options_repr():
     # WHEN
@@ -31,17 +46,7 @@ def test_session_options_repr():
         stats_dump_interval=30.0,
     )
     # THEN
-    assert (
-        "SessionOptions("
-        "message_compression_algorithm=<CompressionAlgorithmType.ZLIB>,"
-        " timeouts=Timeouts(),"
-        " host_health_monitor=BasicHealthMonitor(),"
-        " num_processing_threads=1,"
-        " blob_buffer_size=5000,"
-        " channel_high_watermark=8000000,"
-        " event_queue_watermarks=(6000000, 7000000),"
-        " stats_dump_interval=30.0)" == repr(one)
-    )
+    assert EXPECTED_SESSION_OPTIONS_REPR == repr(one)
 
 
 def test_session_options_default_repr():
@@ -67,7 +72,7 @@ def test_session_options_default_to_none():
 
 def test_session_options_equality():
     # GIVEN
-    left = blazingmq.SessionOptions()
+    left = DEFAULT_OPTIONS
 
     # WHEN
     right = blazingmq.SessionOptions()
@@ -77,26 +82,46 @@ def test_session_options_equality():
     assert (left != right) is False
 
 
+def test_session_options_equal_to_itself():
+    # GIVEN
+    options = blazingmq.SessionOptions(num_processing_threads=1)
+
+    # THEN
+    assert options == options
+    assert (options != options) is False
+
+
+# A value that differs from the default for each field of SessionOptions
+FIELD_VALUES = [
+    ("message_compression_algorithm", blazingmq.CompressionAlgorithmType.ZLIB),
+    ("timeouts", blazingmq.Timeouts()),
+    ("host_health_monitor", blazingmq.BasicHealthMonitor()),
+    ("num_processing_threads", 1),
+    ("blob_buffer_size", 5000),
+    ("channel_high_watermark", 8000000),
+    ("event_queue_watermarks", (6000000, 7000000)),
+    ("stats_dump_interval", 30.0),
+]
+
+
+@pytest.mark.parametrize("right", [None, "string"])
+def test_session_options_other_inequality(right):
+    # GIVEN
+    left = DEFAULT_OPTIONS
+
+    # THEN
+    assert not left == right
+
+
 @pytest.mark.parametrize(
-    "right",
-    [
-        None,
-        "string",
-        blazingmq.SessionOptions(
-            message_compression_algorithm=blazingmq.CompressionAlgorithmType.ZLIB
-        ),
-        blazingmq.SessionOptions(timeouts=blazingmq.Timeouts()),
-        blazingmq.SessionOptions(host_health_monitor=blazingmq.BasicHealthMonitor()),
-        blazingmq.SessionOptions(num_processing_threads=1),
-        blazingmq.SessionOptions(blob_buffer_size=5000),
-        blazingmq.SessionOptions(channel_high_watermark=8000000),
-        blazingmq.SessionOptions(event_queue_watermarks=(6000000, 7000000)),
-        blazingmq.SessionOptions(stats_dump_interval=30.0),
-    ],
+    "field, value", FIELD_VALUES, ids=[field for field, _ in FIELD_VALUES]
 )
-def test_queue_options_other_inequality(right):
+def test_session_options_field_inequality(field, value):
     # GIVEN
-    left = blazingmq.SessionOptions()
+    left = DEFAULT_OPTIONS
+
+    # WHEN
+    right = blazingmq.SessionOptions(**{field: value})
 
     # THEN
     assert not left == right
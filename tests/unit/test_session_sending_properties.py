@@ -13,6 +13,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import re
+
+import mock
 import pytest
 
 from blazingmq import Error
@@ -25,96 +28,100 @@ from .support import INT32
 from .support import INT64
 from .support import SHORT
 from .support import STRING
-from .support import make_session
-
-
-def test_session_post_with_properties(ext):
-    # GIVEN
-    ext.mock_add_spec(["post"])
-    session = make_session()
-    properties = {"a": "b"}
-    property_type_overrides = {}
-    merged = {b"a": (b"b", STRING)}
-
-    # WHEN
-    session.post(
-        "queue_uri",
-        b"data",
-        properties=properties,
-        property_type_overrides=property_type_overrides,
-    )
-
-    # THEN
-    ext.post.assert_called_once_with(
-        b"queue_uri",
-        b"data",
-        properties=merged,
-        on_ack=None,
-    )
-
-
-def test_session_post_property_default_types(ext):
-    # GIVEN
-    ext.mock_add_spec(["post"])
-    session = make_session()
-    properties = {"Bool": True, "Int": 65536, "Str": "\xE4"}
-    merged = {
-        b"Bool": (True, BOOL),
-        b"Int": (65536, INT64),
-        b"Str": (b"\xC3\xA4", STRING),
-    }
-
-    # WHEN
-    session.post(
-        "queue_uri",
-        b"data",
-        properties=properties,
-    )
-
-    # THEN
-    ext.post.assert_called_once_with(
-        b"queue_uri",
-        b"data",
-        properties=merged,
-        on_ack=None,
-    )
-
-
-def test_session_post_property_default_for_byte_string_is_binary_in_3(ext):
-    # GIVEN
-    ext.mock_add_spec(["post"])
-    session = make_session()
-    properties = {"Bytes": b"a\0b"}
-    merged = {b"Bytes": (b"a\0b", BINARY)}
-
-    # WHEN
-    session.post("queue_uri", b"data", properties=properties)
-
-    # THEN
-    ext.post.assert_called_once_with(
-        b"queue_uri",
-        b"data",
-        properties=merged,
-        on_ack=None,
-    )
-
-
-def test_session_post_property_type_overrides(ext):
-    # GIVEN
-    ext.mock_add_spec(["post"])
-    session = make_session()
-    properties = {"Bool": True, "Int": 65536, "Bytes": b"a"}
-    property_type_overrides = {
-        "Bool": PropertyType.SHORT,
-        "Int": PropertyType.INT32,
-        "Bytes": PropertyType.CHAR,
-    }
-    merged = {
-        b"Bool": (1, SHORT),
-        b"Int": (65536, INT32),
-        b"Bytes": (b"a", CHAR),
-    }
 
+NOT_EXPECTING_TYPE_RE = re.compile("not expecting type")
+NON_EXISTENT_INT_OVERRIDE_RE = re.compile(
+    "Received override for non-existent property 'Int'"
+)
+NON_EXISTENT_BOOL_OVERRIDE_RE = re.compile(
+    "Received override for non-existent property 'Bool'"
+)
+UNSUPPORTED_FLOAT_RE = re.compile("Property values of type 'float' are not supported")
+
+
+class IntSubclass(int):
+    pass
+
+
+class StrSubclass(str):
+    pass
+
+
+@pytest.fixture(scope="module")
+def shared_ext_cls():
+    ext_cls = mock.MagicMock()
+    ext_cls.mock_add_spec([])
+    ext_cls.return_value.mock_add_spec(["post"])
+    return ext_cls
+
+
+@pytest.fixture()
+def ext(shared_ext_cls, monkeypatch):
+    # Spec the mock once per module and only clear its recorded calls after
+    # each test, rather than building a new one for every test.
+    monkeypatch.setattr("blazingmq._session.ExtSession", shared_ext_cls)
+    yield shared_ext_cls.return_value
+    shared_ext_cls.reset_mock()
+
+
+@pytest.mark.parametrize(
+    "properties, property_type_overrides, merged",
+    [
+        ({"a": "b"}, {}, {b"a": (b"b", STRING)}),
+        (
+            {"Bool": True, "Int": 65536, "Str": "\xE4"},
+            None,
+            {
+                b"Bool": (True, BOOL),
+                b"Int": (65536, INT64),
+                b"Str": (b"\xC3\xA4", STRING),
+            },
+        ),
+        ({"Bytes": b"a\0b"}, None, {b"Bytes": (b"a\0b", BINARY)}),
+        (
+            {"Int": IntSubclass(65536), "Str": StrSubclass("b")},
+            None,
+            {b"Int": (65536, INT64), b"Str": (b"b", STRING)},
+        ),
+        (
+            {"Bool": True, "Int": 65536, "Bytes": b"a"},
+            {
+                "Bool": PropertyType.SHORT,
+                "Int": PropertyType.INT32,
+                "Bytes": PropertyType.CHAR,
+            },
+            {
+                b"Bool": (1, SHORT),
+                b"Int": (65536, INT32),
+                b"Bytes": (b"a", CHAR),
+            },
+        ),
+        (
+            {"Bool": True, "Int": 65536, b"Bytes": b"a"},
+            {
+                b"Bool": PropertyType.SHORT,
+                b"Int": PropertyType.INT32,
+                "Bytes": PropertyType.CHAR,
+            },
+            {
+                b"Bool": (1, SHORT),
+                b"Int": (65536, INT32),
+                b"Bytes": (b"a", CHAR),
+            },
+        ),
+    ],
+    ids=[
+        "with_properties",
+        "default_types",
+        "default_for_byte_string_is_binary",
+        "default_types_for_subclasses",
+        "type_overrides",
+        "type_overrides_mixed_bytes_unicode",
+    ],
+)
+def test_session_post_properties(
+    ext, session, properties, property_type_overrides, merged
+):
     # WHEN
     session.post(
         "queue_uri",
@@ -132,50 +139,51 @@ def test_session_post_property_type_overrides(ext):
     )
 
 
-def test_session_post_property_type_overrides_mixed_bytes_unicode(ext):
-    # GIVEN
-    ext.mock_add_spec(["post"])
-    session = make_session()
-    properties = {"Bool": True, "Int": 65536, b"Bytes": b"a"}
-    property_type_overrides = {
-        b"Bool": PropertyType.SHORT,
-        b"Int": PropertyType.INT32,
-        "Bytes": PropertyType.CHAR,
-    }
-    merged = {
-        b"Bool": (1, SHORT),
-        b"Int": (65536, INT32),
-        b"Bytes": (b"a", CHAR),
-    }
-
+@pytest.mark.parametrize(
+    "properties, property_type_overrides, expected_exception, expected_pattern",
+    [
+        (
+            {True: True},
+            {True: PropertyType.SHORT},
+            TypeError,
+            NOT_EXPECTING_TYPE_RE,
+        ),
+        (
+            {"Bool": True},
+            {"Bool": PropertyType.SHORT, "Int": PropertyType.INT32},
+            Error,
+            NON_EXISTENT_INT_OVERRIDE_RE,
+        ),
+        (
+            None,
+            {"Bool": PropertyType.SHORT},
+            Error,
+            NON_EXISTENT_BOOL_OVERRIDE_RE,
+        ),
+        (
+            {"Float": 42.0},
+            None,
+            Error,
+            UNSUPPORTED_FLOAT_RE,
+        ),
+    ],
+    ids=[
+        "invalid_property_name_type",
+        "extra_property_type_overrides",
+        "type_overrides_without_properties",
+        "unsupported_property_value",
+    ],
+)
+def test_session_post_invalid_properties(
+    ext,
+    session,
+    properties,
+    property_type_overrides,
+    expected_exception,
+    expected_pattern,
+):
     # WHEN
-    session.post(
-        "queue_uri",
-        b"data",
-        properties=properties,
-        property_type_overrides=property_type_overrides,
-    )
-
-    # THEN
-    ext.post.assert_called_once_with(
-        b"queue_uri",
-        b"data",
-        properties=merged,
-        on_ack=None,
-    )
-
-
-def test_session_post_property_type_with_invalid_property_name_type(ext):
-    # GIVEN
-    ext.mock_add_spec(["post"])
-    session = make_session()
-    properties = {True: True}
-    property_type_overrides = {
-        True: PropertyType.SHORT,
-    }
-
-    # WHEN
-    with pytest.raises(Exception) as exc:
+    with pytest.raises(expected_exception, match=expected_pattern) as exc:
         session.post(
             "queue_uri",
             b"data",
@@ -184,64 +192,4 @@ def test_session_post_property_type_with_invalid_property_name_type(ext):
         )
 
     # THEN
-    assert exc.type is TypeError
-    assert exc.match("not expecting type")
-
-
-def test_session_post_extra_property_type_overrides(ext):
-    # GIVEN
-    ext.mock_add_spec(["post"])
-    session = make_session()
-    properties = {"Bool": True}
-    property_type_overrides = {"Bool": PropertyType.SHORT, "Int": PropertyType.INT32}
-
-    # WHEN
-    with pytest.raises(Exception) as exc:
-        session.post(
-            "queue_uri",
-            b"data",
-            properties=properties,
-            property_type_overrides=property_type_overrides,
-        )
-
-    # THEN
-    assert exc.type is Error
-    assert exc.match("Received override for non-existent property 'Int'")
-
-
-def test_session_post_property_type_overrides_without_properties(ext):
-    # GIVEN
-    ext.mock_add_spec(["post"])
-    session = make_session()
-    property_type_overrides = {"Bool": PropertyType.SHORT}
-
-    # WHEN
-    with pytest.raises(Exception) as exc:
-        session.post(
-            "queue_uri",
-            b"data",
-            property_type_overrides=property_type_overrides,
-        )
-
-    # THEN
-    assert exc.type is Error
-    assert exc.match("Received override for non-existent property 'Bool'")
-
-
-def test_session_post_unsupported_property_value(ext):
-    # GIVEN
-    ext.mock_add_spec(["post"])
-    session = make_session()
-    properties = {"Float": 42.0}
-
-    # WHEN
-    with pytest.raises(Exception) as exc:
-        session.post(
-            "queue_uri",
-            b"data",
-            properties=properties,
-        )
-
-    # THEN
-    assert exc.type is Error
-    assert exc.match("Property values of type 'float' are not supported")
+    assert exc.type is expected_exception
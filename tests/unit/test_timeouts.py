@@ -17,6 +17,18 @@ import pytest
 
 import blazingmq
 
+EXPECTED_TIMEOUTS_REPR = (
+    "Timeouts("
+    "connect_timeout=60.0,"
+    " disconnect_timeout=70.0,"
+    " open_queue_timeout=80.0,"
+    " configure_queue_timeout=90.0,"
+    " close_queue_timeout=100.0)"
+)
+
+# Shared by the comparison tests, which never modify it
+DEFAULT_TIMEOUTS = blazingmq.Timeouts()
+
 
 def test_timeouts_repr():
     # WHEN
@@ -28,14 +40,7 @@ def test_timeouts_repr():
         close_queue_timeout=100.0,
     )
     # THEN
-    assert (
-        "Timeouts("
-        "connect_timeout=60.0,"
-        " disconnect_timeout=70.0,"
-        " open_queue_timeout=80.0,"
-        " configure_queue_timeout=90.0,"
-        " close_queue_timeout=100.0)" == repr(one)
-    )
+    assert EXPECTED_TIMEOUTS_REPR == repr(one)
 
 
 def test_timeouts_default_repr():
@@ -58,7 +63,7 @@ def test_timeouts_default_to_none():
 
 def test_timeouts_equality():
     # GIVEN
-    left = blazingmq.Timeouts()
+    left = DEFAULT_TIMEOUTS
 
     # WHEN
     right = blazingmq.Timeouts()
@@ -68,21 +73,31 @@ def test_timeouts_equality():
     assert (left != right) is False
 
 
+def test_timeouts_equal_to_itself():
+    # GIVEN
+    timeouts = blazingmq.Timeouts(connect_timeout=60.0)
+
+    # THEN
+    assert timeouts == timeouts
+    assert (timeouts != timeouts) is False
+
+
 @pytest.mark.parametrize(
-    "right",
+    "make_right",
     [
-        None,
-        "string",
-        blazingmq.Timeouts(connect_timeout=60.0),
-        blazingmq.Timeouts(disconnect_timeout=70.0),
-        blazingmq.Timeouts(open_queue_timeout=80.0),
-        blazingmq.Timeouts(configure_queue_timeout=90.0),
-        blazingmq.Timeouts(close_queue_timeout=100.0),
+        lambda: None,
+        lambda: "string",
+        lambda: blazingmq.Timeouts(connect_timeout=60.0),
+        lambda: blazingmq.Timeouts(disconnect_timeout=70.0),
+        lambda: blazingmq.Timeouts(open_queue_timeout=80.0),
+        lambda: blazingmq.Timeouts(configure_queue_timeout=90.0),
+        lambda: blazingmq.Timeouts(close_queue_timeout=100.0),
     ],
 )
-def test_timeouts_other_inequality(right):
+def test_timeouts_other_inequality(make_right):
     # GIVEN
-    left = blazingmq.Timeouts()
+    left = DEFAULT_TIMEOUTS
+    right = make_right()
 
     # THEN
     assert not left == right